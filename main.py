@@ -32,6 +32,7 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from src.bot.discord_bot import create_bot
 from src.config.logging import get_logger
 from src.config.settings import get_settings
+from src.utils.event_loop import run as run_event_loop
 
 logger = get_logger(__name__)
 
@@ -160,7 +161,7 @@ def cli_main():
     """Command line interface entry point"""
     try:
         # Run the async main function
-        exit_code = asyncio.run(main())
+        exit_code = run_event_loop(main())
         sys.exit(exit_code)
     
     except KeyboardInterrupt:
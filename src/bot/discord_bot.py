@@ -1,4 +1,3 @@
-import asyncio
 from typing import Optional
 import discord
 from discord.ext import commands
@@ -12,6 +11,7 @@ from ..services.scheduler_service import SchedulerService
 from ..services.validation_service import ValidationService
 from ..commands.reminder_commands import ReminderCommands
 from ..observers.reaction_observer import ReactionObserver
+from ..utils.event_loop import run as run_event_loop
 
 logger = get_logger(__name__)
 
@@ -474,7 +474,7 @@ def main():
             await bot.close()
     
     # Run the bot
-    asyncio.run(run())
+    run_event_loop(run())
 
 
 if __name__ == "__main__":
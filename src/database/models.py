@@ -45,4 +45,5 @@ class ValidationModel(Base):
     reminder = relationship("ReminderModel", back_populates="validations")
     
     def __repr__(self) -> str:
-        return f"<ValidationModel(id={self.id}, reminder_id={self.reminder_id}, status={self.status})>"
\ No newline at end of file
+        status = self.status.label if self.status is not None else None
+        return f"<ValidationModel(id={self.id}, reminder_id={self.reminder_id}, status={status})>"
\ No newline at end of file
@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class FrequencyEnum(str, Enum):
@@ -9,11 +9,22 @@ class FrequencyEnum(str, Enum):
     MONTHLY = "monthly"
 
 
-class ValidationStatus(str, Enum):
-    PENDING = "pending"
-    VALIDATED = "validated"
-    EXPIRED = "expired"
-    FAILED = "failed"
+class ValidationStatus(IntEnum):
+    # Integer values are internal only: the database column stores member
+    # names, and user-facing text uses the lowercase label. Values start at
+    # 1 so that no status is falsy.
+    PENDING = 1
+    VALIDATED = 2
+    EXPIRED = 3
+    FAILED = 4
+    
+    @property
+    def label(self) -> str:
+        """Lowercase display name, e.g. 'pending'"""
+        return _VALIDATION_STATUS_LABELS[self]
+
+
+_VALIDATION_STATUS_LABELS = {status: status.name.lower() for status in ValidationStatus}
 
 
 class ReminderStatus(str, Enum):
@@ -1,11 +1,24 @@
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from .enums import ValidationStatus
 
+# (is expired, current status) -> status after a successful validation;
+# any other combination cannot be validated
+_VALIDATE_TRANSITIONS = {
+    (False, ValidationStatus.PENDING): ValidationStatus.VALIDATED,
+    (False, ValidationStatus.EXPIRED): ValidationStatus.VALIDATED,
+}
+
 
 class Validation:
     """Domain model for reminder validations"""
     
+    __slots__ = (
+        "id", "reminder_id", "message_id", "status",
+        "created_at", "validated_at", "_expires_at", "_expires_ts"
+    )
+    
     def __init__(
         self,
         reminder_id: int,
@@ -24,15 +37,32 @@ class Validation:
         self.validated_at = validated_at
         self.expires_at = expires_at
     
+    @property
+    def expires_at(self) -> datetime:
+        """When the validation expires (naive UTC)"""
+        return self._expires_at
+    
+    @expires_at.setter
+    def expires_at(self, value: datetime) -> None:
+        # Naive datetimes are UTC throughout the app; keep an epoch copy so
+        # is_expired() can compare against time.time() without a datetime
+        self._expires_at = value
+        if value is None:
+            self._expires_ts = None
+            return
+        aware = value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+        self._expires_ts = aware.timestamp()
+    
     def mark_as_validated(self) -> None:
         """Mark the validation as successfully validated"""
-        if self.is_expired():
-            raise ValueError("Cannot validate expired validation")
-        
-        if self.status in [ValidationStatus.VALIDATED, ValidationStatus.FAILED]:
+        expired = self.is_expired()
+        new_status = _VALIDATE_TRANSITIONS.get((expired, self.status))
+        if new_status is None:
+            if expired:
+                raise ValueError("Cannot validate expired validation")
             raise ValueError("Validation already completed")
         
-        self.status = ValidationStatus.VALIDATED
+        self.status = new_status
         self.validated_at = datetime.utcnow()
     
     def mark_as_expired(self) -> None:
@@ -45,13 +75,15 @@ class Validation:
     
     def is_expired(self, current_time: Optional[datetime] = None) -> bool:
         """Check if the validation has expired"""
-        check_time = current_time or datetime.utcnow()
-        return check_time >= self.expires_at
+        if current_time is None and self._expires_ts is not None:
+            return time.time() >= self._expires_ts
+        return (current_time or datetime.utcnow()) >= self.expires_at
     
     def time_until_expiry(self, current_time: Optional[datetime] = None) -> timedelta:
         """Get the time remaining until expiry (negative if expired)"""
-        check_time = current_time or datetime.utcnow()
-        return self.expires_at - check_time
+        if current_time is None and self._expires_ts is not None:
+            return timedelta(seconds=self._expires_ts - time.time())
+        return self.expires_at - (current_time or datetime.utcnow())
     
     def is_pending(self) -> bool:
         """Check if the validation is still pending"""
@@ -62,8 +94,8 @@ class Validation:
         return self.status in [ValidationStatus.VALIDATED, ValidationStatus.EXPIRED, ValidationStatus.FAILED]
     
     def __str__(self) -> str:
-        return f"Validation(id={self.id}, reminder_id={self.reminder_id}, status={self.status.value})"
+        return f"Validation(id={self.id}, reminder_id={self.reminder_id}, status={self.status.label})"
     
     def __repr__(self) -> str:
         return (f"Validation(id={self.id}, reminder_id={self.reminder_id}, "
-                f"status={self.status.value}, expires_at={self.expires_at})")
\ No newline at end of file
+                f"status={self.status.label}, expires_at={self.expires_at})")
\ No newline at end of file
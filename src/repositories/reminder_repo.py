@@ -1,11 +1,22 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, func
+from sqlalchemy import bindparam, select, update, func
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 from .base import BaseRepository
 from ..database.models import ReminderModel
 from ..models.enums import ReminderStatus, FrequencyEnum
 
+# Core executemany keyed on id: rows deleted since they were loaded simply
+# match nothing, where an ORM bulk UPDATE by primary key would raise
+# StaleDataError and fail the whole batch
+_UPDATE_NEXT_EXECUTION = (
+    update(ReminderModel.__table__)
+    .where(ReminderModel.__table__.c.id == bindparam("b_id"))
+    .values(next_execution=bindparam("b_next"), updated_at=bindparam("b_updated"))
+)
+
 
 class ReminderRepository(BaseRepository[ReminderModel]):
     """Repository for reminder-specific database operations"""
@@ -92,6 +103,41 @@ class ReminderRepository(BaseRepository[ReminderModel]):
             return True
         return False
     
+    async def bulk_update_next_executions(self, updates: List[Tuple[int, datetime]]) -> int:
+        """Update next execution times for multiple reminders in a single round-trip.
+        
+        Reminders that no longer exist are skipped; returns the number of rows
+        actually updated. On failure the session is rolled back and the error
+        re-raised.
+        """
+        if not updates:
+            return 0
+        
+        updated_at = datetime.utcnow()
+        try:
+            result = await self.session.execute(
+                _UPDATE_NEXT_EXECUTION,
+                [
+                    {"b_id": reminder_id, "b_next": next_execution, "b_updated": updated_at}
+                    for reminder_id, next_execution in updates
+                ]
+            )
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        
+        # A Core UPDATE bypasses the ORM, so bring reminders already loaded in
+        # this session up to date with what was written
+        identity_map = self.session.identity_map
+        for reminder_id, next_execution in updates:
+            reminder = identity_map.get(identity_key(ReminderModel, reminder_id))
+            if reminder is not None:
+                set_committed_value(reminder, "next_execution", next_execution)
+                set_committed_value(reminder, "updated_at", updated_at)
+        
+        return result.rowcount
+    
     async def find_by_frequency(self, frequency: FrequencyEnum) -> List[ReminderModel]:
         """Find reminders by frequency"""
         result = await self.session.execute(
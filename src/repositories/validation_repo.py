@@ -118,6 +118,14 @@ class ValidationRepository(BaseRepository[ValidationModel]):
         )
         return result.scalars().all()
     
+    async def bulk_delete_by_reminder_id(self, reminder_id: int) -> int:
+        """Delete all validations for a specific reminder in a single statement"""
+        result = await self.session.execute(
+            delete(ValidationModel).where(ValidationModel.reminder_id == reminder_id)
+        )
+        await self.session.commit()
+        return result.rowcount
+    
     async def bulk_mark_expired(self, validation_ids: List[int]) -> int:
         """Mark multiple validations as expired"""
         from sqlalchemy import update
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional
 from ..repositories.reminder_repo import ReminderRepository
 from ..repositories.validation_repo import ValidationRepository
 from ..database.models import ReminderModel
@@ -135,9 +135,7 @@ class ReminderService:
         """Delete a reminder and its associated validations"""
         
         # First, delete any associated validations
-        validations = await self.validation_repo.find_by_reminder_id(reminder_id)
-        for validation in validations:
-            await self.validation_repo.delete(validation.id)
+        deleted_validations = await self.validation_repo.bulk_delete_by_reminder_id(reminder_id)
         
         # Unschedule the reminder
         if self.scheduler_service:
@@ -150,33 +148,26 @@ class ReminderService:
             logger.info(
                 "Deleted reminder",
                 reminder_id=reminder_id,
-                deleted_validations=len(validations)
+                deleted_validations=deleted_validations
             )
         
         return success
     
     async def process_due_reminders(self) -> int:
-        """Process all reminders that are due for execution"""
+        """Process all reminders that are due for execution
+        
+        Next execution times are written in one batch after every due reminder
+        has been sent. If that write fails, nothing is rescheduled and 0 is
+        returned even though notifications went out, so those reminders are
+        re-sent on the next tick.
+        """
         from datetime import datetime
         current_time = datetime.utcnow()
         logger.debug("Checking for due reminders...", current_time=current_time)
         due_reminders = await self.reminder_repo.find_due_reminders()
         logger.info(f"Found {len(due_reminders)} due reminders", current_time=current_time)
         
-        # Debug: Check all active reminders and their next execution times
-        all_reminders = await self.reminder_repo.find_active_reminders()
-        for reminder in all_reminders:
-            is_due = reminder.next_execution <= current_time
-            logger.debug(
-                "Reminder check",
-                reminder_id=reminder.id,
-                next_execution=reminder.next_execution,
-                current_time=current_time,
-                is_due=is_due,
-                time_diff_seconds=(current_time - reminder.next_execution).total_seconds()
-            )
-        
-        processed_count = 0
+        next_executions = []
         
         for reminder_model in due_reminders:
             try:
@@ -204,12 +195,7 @@ class ReminderService:
                     new_next_execution=domain_reminder.next_execution
                 )
                 
-                await self.reminder_repo.update_next_execution(
-                    reminder_model.id,
-                    domain_reminder.next_execution
-                )
-                
-                processed_count += 1
+                next_executions.append((reminder_model.id, domain_reminder.next_execution))
                 
                 logger.info(
                     "Processed due reminder",
@@ -224,6 +210,16 @@ class ReminderService:
                     error=str(e)
                 )
         
+        try:
+            processed_count = await self.reminder_repo.bulk_update_next_executions(next_executions)
+        except Exception as e:
+            logger.error(
+                "Reminders sent but not rescheduled",
+                reminder_ids=[reminder_id for reminder_id, _ in next_executions],
+                error=str(e)
+            )
+            processed_count = 0
+        
         return processed_count
     
     async def validate_reminder_permission(self, user_roles: List[str], admin_role_ids: List[int]) -> bool:
@@ -249,9 +245,13 @@ class ReminderService:
             "pending_validations": pending_validations
         }
     
-    async def cleanup_old_reminders(self, cutoff_days: int = 30) -> int:
+    async def cleanup_old_reminders(
+        self,
+        cutoff_days: int = 30,
+        now: Callable[[], datetime] = datetime.utcnow
+    ) -> int:
         """Clean up old completed reminders"""
-        cutoff_date = datetime.utcnow() - timedelta(days=cutoff_days)
+        cutoff_date = now() - timedelta(days=cutoff_days)
         cleaned_count = await self.reminder_repo.cleanup_completed_reminders(cutoff_date)
         
         logger.info(
@@ -269,8 +269,7 @@ class ReminderService:
         # Handle scheduler updates
         if self.scheduler_service:
             if status == ReminderStatus.PAUSED:
-                for reminder_id in reminder_ids:
-                    await self.scheduler_service.unschedule_reminder(reminder_id)
+                await self.scheduler_service.bulk_unschedule(reminder_ids)
             elif status == ReminderStatus.ACTIVE:
                 for reminder_id in reminder_ids:
                     reminder = await self.get_reminder_by_id(reminder_id)
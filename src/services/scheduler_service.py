@@ -1,12 +1,75 @@
 import asyncio
+import contextvars
+import heapq
+import itertools
+import sys
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from ..models.reminder import Reminder
 from ..config.settings import get_settings
 from ..config.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Python 3.12+ can start a task eagerly, running it synchronously until its
+# first real suspension instead of waiting for the next loop iteration
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
+# create_task() accepts an explicit context from Python 3.11
+_TASKS_ACCEPT_CONTEXT = sys.version_info >= (3, 11)
+
+
+# Stale heap entries (unscheduled or rescheduled reminders) are dropped
+# lazily; the heap is only rebuilt once it is large and mostly stale, the
+# same rule asyncio applies to cancelled timer handles
+_MIN_HEAP_SIZE_FOR_COMPACTION = 100
+_MIN_STALE_FRACTION_FOR_COMPACTION = 0.5
+
+
+def _create_task(coro, context: Optional[contextvars.Context] = None) -> asyncio.Task:
+    """Create a task on the running loop, eagerly when supported.
+    
+    A given context is used as-is instead of copying the current one; it is
+    ignored on Pythons that cannot pass a context to create_task().
+    """
+    loop = asyncio.get_running_loop()
+    if not _TASKS_ACCEPT_CONTEXT:
+        context = None
+    if _eager_task_factory is not None:
+        return _eager_task_factory(loop, coro, context=context)
+    if context is not None:
+        return loop.create_task(coro, context=context)
+    return loop.create_task(coro)
+
+
+class _ScheduledRemindersView(Mapping):
+    """Read-only {reminder_id: {"reminder", "when", "seq"}} view of a scheduler.
+    
+    Entries are built on access from the scheduler's per-field maps.
+    """
+    __slots__ = ("_scheduler",)
+    
+    def __init__(self, scheduler: "SchedulerService"):
+        self._scheduler = scheduler
+    
+    def __getitem__(self, reminder_id: int) -> Dict[str, Any]:
+        scheduler = self._scheduler
+        return {
+            "reminder": scheduler._reminders[reminder_id],
+            "when": scheduler._due_times[reminder_id],
+            "seq": scheduler._sequences[reminder_id]
+        }
+    
+    def __contains__(self, reminder_id: object) -> bool:
+        return reminder_id in self._scheduler._reminders
+    
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._scheduler._reminders)
+    
+    def __len__(self) -> int:
+        return len(self._scheduler._reminders)
+
 
 class SchedulerService:
     """Service for managing reminder scheduling and execution"""
@@ -14,7 +77,18 @@ class SchedulerService:
     def __init__(self, reminder_service=None):
         self.reminder_service = reminder_service  # Injected to avoid circular imports
         self.settings = get_settings()
-        self._scheduled_reminders: Dict[int, Dict[str, Any]] = {}
+        # Scheduled state is kept as parallel maps keyed by reminder_id
+        self._reminders: Dict[int, Reminder] = {}
+        self._due_times: Dict[int, float] = {}
+        self._sequences: Dict[int, int] = {}
+        # Min-heap of (loop time, sequence, reminder_id) drained by a single
+        # dispatcher task. The sequence number keeps equal due times in FIFO
+        # order and identifies the live entry for each reminder.
+        self._heap: List[Tuple[float, int, int]] = []
+        self._sequence = itertools.count()
+        self._wake = asyncio.Event()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._dispatcher: Optional[asyncio.Task] = None
         self._task: Optional[asyncio.Task] = None
         self._check_interval = self.settings.scheduling.check_interval_minutes * 60  # Convert to seconds
         self.is_running = False
@@ -33,7 +107,7 @@ class SchedulerService:
             return
         
         self.is_running = True
-        self._task = asyncio.create_task(self._scheduler_loop())
+        self._task = _create_task(self._scheduler_loop())
         logger.info("Scheduler started")
     
     async def stop(self) -> None:
@@ -61,28 +135,32 @@ class SchedulerService:
     
     async def schedule_reminder(self, reminder: Reminder) -> None:
         """Schedule a reminder for execution"""
-        # Cancel existing task if already scheduled
-        if reminder.id in self._scheduled_reminders:
-            existing_task = self._scheduled_reminders[reminder.id]["task"]
-            existing_task.cancel()
+        loop_now, now = self._now()
+        if reminder.next_execution <= now:
+            # Past due: run it now rather than round-tripping through the heap
+            self._forget(reminder.id)
+            logger.info("Executing past due reminder", reminder_id=reminder.id)
+            await self._run_reminder(reminder)
+            return
         
         # Calculate delay until execution
-        now = datetime.utcnow()
-        if reminder.next_execution <= now:
-            # Execute immediately if past due
-            delay = 0
-        else:
-            delay = (reminder.next_execution - now).total_seconds()
-        
-        # Create new task
-        task = asyncio.create_task(self._wait_and_execute(reminder, delay))
-        
-        # Store in scheduled reminders
-        self._scheduled_reminders[reminder.id] = {
-            "reminder": reminder,
-            "task": task,
-            "scheduled_at": now
-        }
+        delay = (reminder.next_execution - now).total_seconds()
+        when = loop_now + delay
+        
+        # Replacing an existing entry leaves its old heap entry stale; the
+        # dispatcher skips entries whose sequence no longer matches
+        seq = next(self._sequence)
+        self._reminders[reminder.id] = reminder
+        self._due_times[reminder.id] = when
+        self._sequences[reminder.id] = seq
+        heapq.heappush(self._heap, (when, seq, reminder.id))
+        self._maybe_compact_heap()
+        self._ensure_dispatcher()
+        
+        # The dispatcher's timer already covers anything due after the
+        # current head, so only wake it when this entry becomes the head
+        if self._heap[0][1] == seq:
+            self._wake.set()
         
         logger.info(
             "Scheduled reminder",
@@ -93,19 +171,29 @@ class SchedulerService:
     
     async def unschedule_reminder(self, reminder_id: int) -> bool:
         """Unschedule a reminder"""
-        if reminder_id not in self._scheduled_reminders:
+        # The heap entry is left in place and skipped when it comes due
+        if not self._forget(reminder_id):
             return False
-        
-        task_info = self._scheduled_reminders[reminder_id]
-        task_info["task"].cancel()
-        del self._scheduled_reminders[reminder_id]
+        self._maybe_compact_heap()
         
         logger.info("Unscheduled reminder", reminder_id=reminder_id)
         return True
     
+    async def bulk_unschedule(self, reminder_ids: List[int]) -> int:
+        """Unschedule multiple reminders in a single pass"""
+        unscheduled_count = 0
+        
+        for reminder_id in reminder_ids:
+            if self._forget(reminder_id):
+                unscheduled_count += 1
+        self._maybe_compact_heap()
+        
+        logger.info("Bulk unscheduled reminders", count=unscheduled_count)
+        return unscheduled_count
+    
     async def reschedule_reminder(self, reminder: Reminder) -> None:
         """Reschedule an existing reminder with new execution time"""
-        if reminder.id in self._scheduled_reminders:
+        if reminder.id in self._reminders:
             await self.unschedule_reminder(reminder.id)
         
         await self.schedule_reminder(reminder)
@@ -118,39 +206,73 @@ class SchedulerService:
     
     async def update_reminder_schedule(self, reminder_id: int, new_execution_time: datetime) -> bool:
         """Update the execution time for a scheduled reminder"""
-        if reminder_id not in self._scheduled_reminders:
+        reminder = self._reminders.get(reminder_id)
+        if reminder is None:
             return False
         
-        task_info = self._scheduled_reminders[reminder_id]
-        reminder = task_info["reminder"]
         reminder.next_execution = new_execution_time
         
         await self.reschedule_reminder(reminder)
         return True
     
+    @property
+    def _scheduled_reminders(self) -> Mapping:
+        """Per-reminder view of the scheduled state"""
+        return _ScheduledRemindersView(self)
+    
+    def _forget(self, reminder_id: int) -> bool:
+        """Drop a reminder's scheduled state; return whether it was scheduled"""
+        if self._reminders.pop(reminder_id, None) is None:
+            return False
+        del self._due_times[reminder_id]
+        del self._sequences[reminder_id]
+        return True
+    
+    def _maybe_compact_heap(self) -> None:
+        """Rebuild the heap without stale entries once they dominate it"""
+        heap_size = len(self._heap)
+        if heap_size <= _MIN_HEAP_SIZE_FOR_COMPACTION:
+            return
+        stale_count = heap_size - len(self._reminders)
+        if stale_count / heap_size <= _MIN_STALE_FRACTION_FOR_COMPACTION:
+            return
+        
+        sequences = self._sequences
+        self._heap = [entry for entry in self._heap if sequences.get(entry[2]) == entry[1]]
+        heapq.heapify(self._heap)
+    
     def get_scheduled_count(self) -> int:
         """Get the number of currently scheduled reminders"""
-        return len(self._scheduled_reminders)
+        return len(self._reminders)
     
     def is_reminder_scheduled(self, reminder_id: int) -> bool:
         """Check if a reminder is currently scheduled"""
-        return reminder_id in self._scheduled_reminders
+        return reminder_id in self._reminders
+    
+    def iter_next_execution_times(self) -> Iterator[Tuple[int, datetime]]:
+        """Iterate (reminder_id, next execution time) for scheduled reminders"""
+        return (
+            (reminder_id, reminder.next_execution)
+            for reminder_id, reminder in self._reminders.items()
+        )
     
     def get_next_execution_times(self) -> Dict[int, datetime]:
         """Get next execution times for all scheduled reminders"""
-        return {
-            reminder_id: info["reminder"].next_execution
-            for reminder_id, info in self._scheduled_reminders.items()
-        }
+        return dict(self.iter_next_execution_times())
     
     async def clear_all_scheduled(self) -> int:
         """Clear all scheduled reminders"""
-        count = len(self._scheduled_reminders)
+        count = len(self._reminders)
         
-        for task_info in self._scheduled_reminders.values():
-            task_info["task"].cancel()
+        self._reminders.clear()
+        self._due_times.clear()
+        self._sequences.clear()
+        self._heap.clear()
+        self._cancel_timer()
         
-        self._scheduled_reminders.clear()
+        if self._dispatcher:
+            self._dispatcher.cancel()
+            self._dispatcher = None
         
         logger.info("Cleared all scheduled reminders", count=count)
         return count
@@ -178,26 +300,66 @@ class SchedulerService:
         
         logger.info("Scheduler loop stopped")
     
-    async def _wait_and_execute(self, reminder: Reminder, delay: float) -> None:
-        """Wait for the specified delay and then execute the reminder"""
-        try:
-            if delay > 0:
-                await asyncio.sleep(delay)
+    def _ensure_dispatcher(self) -> None:
+        """Start the dispatcher task if it is not already running"""
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = _create_task(self._dispatch_loop())
+    
+    async def _dispatch_loop(self) -> None:
+        """Execute scheduled reminders as they come due"""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            self._wake.clear()
+            now = loop.time()
             
-            await self._execute_reminder(reminder)
+            # Drain everything that is due in one pass
+            batch = []
+            while self._heap and self._heap[0][0] <= now:
+                _, seq, reminder_id = heapq.heappop(self._heap)
+                if self._sequences.get(reminder_id) != seq:
+                    # Unscheduled or rescheduled since this entry was pushed
+                    continue
+                
+                batch.append(self._reminders[reminder_id])
+                self._forget(reminder_id)
             
-        except asyncio.CancelledError:
-            logger.debug("Reminder execution cancelled", reminder_id=reminder.id)
+            if batch:
+                # Each execution gets a fresh empty context rather than a
+                # copy of the dispatcher's, so no caller's contextvars leak in
+                await asyncio.gather(*(
+                    _create_task(self._run_reminder(reminder), contextvars.Context())
+                    for reminder in batch
+                ))
+                continue
+            
+            # Sleep until the earliest entry is due or the schedule changes,
+            # using one loop timer for the heap head rather than one per reminder
+            self._cancel_timer()
+            if self._heap:
+                self._timer = loop.call_at(self._heap[0][0], self._wake.set)
+            await self._wake.wait()
+    
+    def _now(self) -> Tuple[float, datetime]:
+        """Current (loop time, UTC time), read together"""
+        return asyncio.get_running_loop().time(), datetime.utcnow()
+    
+    def _cancel_timer(self) -> None:
+        """Cancel the pending dispatcher wake-up timer, if any"""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+    
+    async def _run_reminder(self, reminder: Reminder) -> None:
+        """Execute a due reminder, logging any error"""
+        try:
+            await self._execute_reminder(reminder)
         except Exception as e:
             logger.error(
                 "Error executing reminder",
                 reminder_id=reminder.id,
                 error=str(e)
             )
-        finally:
-            # Remove from scheduled reminders
-            if reminder.id in self._scheduled_reminders:
-                del self._scheduled_reminders[reminder.id]
     
     async def _execute_reminder(self, reminder: Reminder) -> None:
         """Execute a reminder by delegating to ReminderService"""
@@ -225,7 +387,7 @@ class SchedulerService:
             "check_interval_seconds": self._check_interval,
             "next_executions": {
                 str(reminder_id): execution_time.isoformat()
-                for reminder_id, execution_time in self.get_next_execution_times().items()
+                for reminder_id, execution_time in self.iter_next_execution_times()
             }
         }
     
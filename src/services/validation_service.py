@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
 import discord
 from ..repositories.validation_repo import ValidationRepository
 from ..repositories.reminder_repo import ReminderRepository
@@ -68,7 +68,7 @@ class ValidationService:
             logger.debug(
                 "Validation not pending",
                 validation_id=validation_model.id,
-                status=validation_model.status.value
+                status=validation_model.status.label
             )
             return False
         
@@ -198,9 +198,13 @@ class ValidationService:
             "total": total
         }
     
-    async def cleanup_old_validations(self, days_old: int = 7) -> int:
+    async def cleanup_old_validations(
+        self,
+        days_old: int = 7,
+        now: Callable[[], datetime] = datetime.utcnow
+    ) -> int:
         """Clean up old expired/failed validations"""
-        cutoff_time = datetime.utcnow() - timedelta(days=days_old)
+        cutoff_time = now() - timedelta(days=days_old)
         cleaned_count = await self.validation_repo.cleanup_expired_validations(cutoff_time)
         
         logger.info(
@@ -1,27 +1,31 @@
 import pytest
-import asyncio
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.pool import StaticPool
 
 from src.database.models import Base
 from src.database.connection import DatabaseManager
 from src.models.enums import FrequencyEnum, ValidationStatus, ReminderStatus
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
 
+if uvloop is not None:
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed, matching production"""
+        return {"uvloop": uvloop.new_event_loop}
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 async def test_database():
-    """Create a test database for each test"""
+    """Create one in-memory test database per session"""
     # Use in-memory SQLite for fast testing
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
@@ -30,18 +34,21 @@ async def test_database():
         echo=False
     )
     
+    # The sqlite3 driver's own transaction handling breaks SAVEPOINT, so
+    # let SQLAlchemy emit BEGIN itself
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
     # Create tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
-    # Create session factory
-    session_factory = async_sessionmaker(
-        bind=engine,
-        class_=AsyncSession,
-        expire_on_commit=False
-    )
-    
-    yield session_factory
+    yield engine
     
     # Cleanup
     await engine.dispose()
@@ -49,10 +56,23 @@ async def test_database():
 
 @pytest.fixture
 async def db_session(test_database):
-    """Create a database session for each test"""
-    async with test_database() as session:
-        yield session
-        await session.rollback()
+    """Create a database session whose changes are rolled back after each test.
+    
+    Repository commits only release a savepoint inside the outer transaction,
+    so every test starts from the empty schema.
+    """
+    async with test_database.connect() as conn:
+        await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await conn.rollback()
 
 
 @pytest.fixture
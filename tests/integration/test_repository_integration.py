@@ -1,9 +1,39 @@
 import pytest
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from sqlalchemy import event
 from src.repositories.reminder_repo import ReminderRepository
 from src.repositories.validation_repo import ValidationRepository
 from src.database.models import ReminderModel, ValidationModel
 from src.models.enums import ReminderStatus, ValidationStatus, FrequencyEnum
+from src.services.reminder_service import ReminderService
+
+
+# db_session wraps each test in a transaction and turns commits into
+# savepoints; those statements come from the fixture, not the code under test
+_SAVEPOINT_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+@contextmanager
+def count_queries(engine, cache_hits=None):
+    """Collect every SQL statement sent to the database while active.
+
+    When a cache_hits list is given, each statement's compiled-cache status
+    is appended to it as well.
+    """
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith(_SAVEPOINT_PREFIXES):
+            queries.append(statement)
+            if cache_hits is not None:
+                cache_hits.append(context.cache_hit)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
 
 
 class TestRepositoryIntegration:
@@ -294,4 +324,77 @@ class TestRepositoryIntegration:
         assert pending_validations == 3
         
         validated_validations = await validation_repo.count_by_status(ValidationStatus.VALIDATED)
-        assert validated_validations == 2
\ No newline at end of file
+        assert validated_validations == 2
+    
+    @pytest.mark.asyncio
+    async def test_process_due_reminders_query_count(self, db_session):
+        """Test that processing due reminders issues one SELECT and one UPDATE"""
+        reminder_repo = ReminderRepository(db_session)
+        service = ReminderService(reminder_repo, ValidationRepository(db_session))
+        
+        for i in range(3):
+            await reminder_repo.create(ReminderModel(
+                user_id=f"user_{i}",
+                guild_id="987654321",
+                channel_id="111222333",
+                frequency=FrequencyEnum.DAILY,
+                message_content=f"Due reminder {i}",
+                status=ReminderStatus.ACTIVE,
+                created_by="admin_123",
+                next_execution=datetime.utcnow() - timedelta(hours=1)
+            ))
+        
+        with count_queries(db_session.bind) as queries:
+            processed_count = await service.process_due_reminders()
+        
+        assert processed_count == 3
+        assert len(queries) <= 2
+        
+        # Reminders were rescheduled and the session sees the new times
+        assert await reminder_repo.find_due_reminders() == []
+        for reminder in await reminder_repo.find_active_reminders():
+            assert reminder.next_execution > datetime.utcnow()
+    
+    @pytest.mark.asyncio
+    async def test_bulk_update_next_executions_skips_deleted_reminder(self, db_session):
+        """Test that a reminder deleted mid-batch does not block the other updates"""
+        reminder_repo = ReminderRepository(db_session)
+        
+        reminders = []
+        for i in range(2):
+            reminders.append(await reminder_repo.create(ReminderModel(
+                user_id=f"user_{i}",
+                guild_id="987654321",
+                channel_id="111222333",
+                frequency=FrequencyEnum.DAILY,
+                message_content=f"Reminder {i}",
+                status=ReminderStatus.ACTIVE,
+                created_by="admin_123",
+                next_execution=datetime.utcnow() - timedelta(hours=1)
+            )))
+        kept, deleted = reminders
+        deleted_id = deleted.id
+        await reminder_repo.delete(deleted_id)
+        
+        new_time = datetime.utcnow() + timedelta(days=1)
+        updated_count = await reminder_repo.bulk_update_next_executions(
+            [(kept.id, new_time), (deleted_id, new_time)]
+        )
+        
+        assert updated_count == 1
+        assert (await reminder_repo.get_by_id(kept.id)).next_execution == new_time
+        assert await reminder_repo.get_by_id(deleted_id) is None
+    
+    @pytest.mark.asyncio
+    async def test_find_by_user_id_uses_cached_compile(self, db_session):
+        """Test that repeated find_by_user_id calls reuse the compiled statement"""
+        repo = ReminderRepository(db_session)
+        cache_hits = []
+        
+        with count_queries(db_session.bind, cache_hits) as queries:
+            await repo.find_by_user_id("first_user")
+            await repo.find_by_user_id("second_user")
+        
+        # The user id is bound as a parameter, so the second call hits the cache
+        assert len(queries) == 2
+        assert cache_hits[1] == db_session.bind.dialect.CACHE_HIT
@@ -0,0 +1,255 @@
+import discord
+import pytest
+from collections import defaultdict
+from datetime import datetime
+from types import MappingProxyType
+from unittest.mock import AsyncMock
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Import discord, the core domain modules, services and ORM models once at
+# collection time so each xdist worker pays the import and mapper setup
+# cost up front instead of inside the first test.
+import src.factories.reminder_factory  # noqa: F401
+import src.models.enums  # noqa: F401
+import src.models.reminder  # noqa: F401
+import src.services.notification_service  # noqa: F401
+import src.services.reminder_service  # noqa: F401
+import src.services.scheduler_service  # noqa: F401
+import src.services.validation_service  # noqa: F401
+import src.strategies.frequency_strategy  # noqa: F401
+from src.database.models import ReminderModel, ValidationModel  # noqa: F401
+from src.models.enums import FrequencyEnum, ReminderStatus
+from src.repositories.reminder_repo import ReminderRepository
+from src.repositories.validation_repo import ValidationRepository
+from tests.unit.helpers import clone_mock
+
+
+@pytest.fixture(scope="session")
+def _session_template():
+    """Spec'd AsyncSession mock built once per session"""
+    return AsyncMock(spec=AsyncSession)
+
+
+@pytest.fixture(scope="session")
+def _reminder_repo_template():
+    """Spec'd ReminderRepository mock built once per session"""
+    return AsyncMock(spec=ReminderRepository)
+
+
+@pytest.fixture(scope="session")
+def _validation_repo_template():
+    """Spec'd ValidationRepository mock built once per session"""
+    return AsyncMock(spec=ValidationRepository)
+
+
+@pytest.fixture(scope="session")
+def _discord_client_template():
+    """Spec'd discord.Client mock built once per session"""
+    return AsyncMock(spec=discord.Client)
+
+
+@pytest.fixture(scope="session")
+def _scheduler_service_template():
+    """Scheduler service mock built once per session"""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_session(_session_template):
+    """Create a mock async session"""
+    return clone_mock(_session_template)
+
+
+@pytest.fixture
+def mock_reminder_repo(_reminder_repo_template):
+    """Create a mock reminder repository"""
+    return clone_mock(_reminder_repo_template)
+
+
+@pytest.fixture
+def mock_validation_repo(_validation_repo_template):
+    """Create a mock validation repository"""
+    return clone_mock(_validation_repo_template)
+
+
+@pytest.fixture
+def mock_discord_client(_discord_client_template):
+    """Create a mock Discord client"""
+    return clone_mock(_discord_client_template)
+
+
+@pytest.fixture
+def mock_scheduler_service(_scheduler_service_template):
+    """Create a mock scheduler service"""
+    return clone_mock(_scheduler_service_template)
+
+
+_SAMPLE_REMINDER_FIELDS = MappingProxyType({
+    "id": 1,
+    "user_id": "123456789",
+    "guild_id": "987654321",
+    "channel_id": "111222333",
+    "frequency": FrequencyEnum.DAILY,
+    "message_content": "Test reminder",
+    "validation_required": True,
+    "status": ReminderStatus.ACTIVE,
+    "created_by": "admin_123",
+    "next_execution": datetime(2024, 1, 1)
+})
+
+
+@pytest.fixture(scope="session")
+def sample_reminder_model():
+    """Shared reminder model; request mutable_reminder_model to modify it"""
+    return ReminderModel(**_SAMPLE_REMINDER_FIELDS)
+
+
+@pytest.fixture
+def mutable_reminder_model():
+    """Fresh reminder model with the same fields as sample_reminder_model.
+
+    A shallow copy of the shared model would share its SQLAlchemy instance
+    state, so each test builds its own instance instead.
+    """
+    return ReminderModel(**_SAMPLE_REMINDER_FIELDS)
+
+
+@pytest.fixture(scope="session")
+def sample_reminder_data():
+    """Sample reminder creation data (read-only; merge overrides into a new dict)"""
+    return MappingProxyType({
+        "user_id": "123456789",
+        "guild_id": "987654321",
+        "channel_id": "111222333",
+        "frequency": FrequencyEnum.DAILY,
+        "message_content": "Daily standup reminder",
+        "validation_required": True,
+        "created_by": "admin_123"
+    })
+
+
+class StubResult:
+    """Minimal stand-in for a SQLAlchemy Result holding fixed rows.
+
+    rowcount defaults to the number of rows; pass it explicitly for
+    UPDATE/DELETE results that return no rows.
+    """
+    __slots__ = ("_rows", "rowcount")
+
+    def __init__(self, rows=(), rowcount=None):
+        self._rows = rows
+        self.rowcount = len(rows) if rowcount is None else rowcount
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+    def scalar(self):
+        return self.first()
+
+
+class StubSession:
+    """Minimal async session that records executed statements.
+
+    Cheaper than AsyncMock for tests that only need execute() to return
+    rows and to inspect the statement that was issued.
+    """
+    __slots__ = ("statements", "_result")
+
+    def __init__(self):
+        self.statements = []
+        self._result = StubResult([])
+
+    def returns(self, rows):
+        """Make subsequent execute() calls return the given rows"""
+        self._result = StubResult(rows)
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return self._result
+
+
+@pytest.fixture
+def stub_session():
+    """Create a lightweight stub async session"""
+    return StubSession()
+
+
+class StubValidationRepo:
+    """Minimal validation repository that records calls.
+
+    Cheaper than an AsyncMock spec'd on ValidationRepository for service
+    tests. Each call appends its arguments to ``calls[method]``; results
+    are set per method with returns() and default to None, except
+    count_by_status which looks the status up in ``counts`` (default 0).
+    """
+    __slots__ = ("calls", "counts", "_results")
+
+    def __init__(self):
+        self.calls = defaultdict(list)
+        self.counts = {}
+        self._results = {}
+
+    def returns(self, method, value):
+        """Make subsequent calls to the named method return value"""
+        self._results[method] = value
+
+    def _record(self, method, *args):
+        self.calls[method].append(args)
+        return self._results.get(method)
+
+    async def create(self, validation_model):
+        return self._record("create", validation_model)
+
+    async def get_by_id(self, validation_id):
+        return self._record("get_by_id", validation_id)
+
+    async def find_by_message_id(self, message_id):
+        return self._record("find_by_message_id", message_id)
+
+    async def find_by_reminder_id(self, reminder_id):
+        return self._record("find_by_reminder_id", reminder_id)
+
+    async def find_expired_validations(self, current_time=None):
+        return self._record("find_expired_validations", current_time)
+
+    async def find_expiring_soon(self, warning_time):
+        return self._record("find_expiring_soon", warning_time)
+
+    async def mark_as_validated(self, validation_id, validated_at=None):
+        return self._record("mark_as_validated", validation_id, validated_at)
+
+    async def mark_as_expired(self, validation_id):
+        return self._record("mark_as_expired", validation_id)
+
+    async def bulk_mark_expired(self, validation_ids):
+        return self._record("bulk_mark_expired", validation_ids)
+
+    async def count_by_status(self, status):
+        self._record("count_by_status", status)
+        return self.counts.get(status, 0)
+
+    async def cleanup_expired_validations(self, cutoff_time):
+        return self._record("cleanup_expired_validations", cutoff_time)
+
+
+@pytest.fixture
+def stub_validation_repo():
+    """Create a lightweight stub validation repository"""
+    return StubValidationRepo()
+
+
+@pytest.fixture(scope="session")
+def result_with():
+    """Build a stub execute() result from a list of rows.
+
+    Replaces MagicMock result chains such as
+    ``mock_result.scalars.return_value.all.return_value = rows`` or
+    ``mock_result.rowcount = n`` (use ``result_with(rowcount=n)``).
+    """
+    return StubResult
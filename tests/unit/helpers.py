@@ -0,0 +1,33 @@
+import copy
+from sqlalchemy import Column
+from sqlalchemy.sql import visitors
+
+
+def where_columns(statement):
+    """Names of the columns referenced by a statement's WHERE clause.
+
+    Walks the clause tree instead of compiling the statement to SQL text.
+    """
+    return {
+        element.name
+        for element in visitors.iterate(statement.whereclause)
+        if isinstance(element, Column)
+    }
+
+
+def clone_mock(template):
+    """Return an independent copy of a spec'd mock template.
+
+    A shallow copy keeps the (expensive) spec introspection results but
+    would share child mocks and call history with the template, so those
+    are reset on the copy. Magic methods the template has already used
+    live on its class and in its instance dict with the template as their
+    parent; they are dropped and re-created as proxies bound to the copy.
+    """
+    clone = copy.copy(template)
+    clone.__dict__["_mock_children"] = {}
+    for name in type(template).__dict__.keys() & clone.__dict__.keys():
+        del clone.__dict__[name]
+    clone._mock_set_magics()
+    clone.reset_mock(return_value=True, side_effect=True)
+    return clone
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.repositories.base import BaseRepository
 from src.database.models import ReminderModel
@@ -15,12 +15,6 @@ class TestRepository(BaseRepository[ReminderModel]):
 class TestBaseRepository:
     """Test cases for the BaseRepository abstract class"""
     
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock async session"""
-        session = AsyncMock(spec=AsyncSession)
-        return session
-    
     @pytest.fixture
     def repository(self, mock_session):
         """Create a test repository instance"""
@@ -0,0 +1,49 @@
+from unittest.mock import sentinel
+from tests.unit.helpers import clone_mock
+
+
+class TestCloneMock:
+    """Test cases for cloning the session-scoped mock templates"""
+    
+    async def test_magic_method_configured_on_clone_stays_on_clone(self, mock_session, _session_template):
+        """Test that configuring __aenter__ on one clone leaves other clones untouched"""
+        # Arrange
+        other_session = clone_mock(_session_template)
+        
+        # Act
+        mock_session.__aenter__.return_value = sentinel.SESSION
+        async with mock_session as entered:
+            pass
+        
+        # Assert
+        assert entered is sentinel.SESSION
+        assert other_session.__aenter__.return_value is not sentinel.SESSION
+        assert _session_template.__aenter__.return_value is not sentinel.SESSION
+        assert other_session.__aenter__.call_count == 0
+    
+    async def test_clone_of_used_template_gets_fresh_magic_methods(self, _session_template):
+        """Test that a template whose magic methods were used still yields isolated clones"""
+        # Arrange
+        used_template_child = _session_template.__aenter__
+        
+        # Act
+        first = clone_mock(_session_template)
+        second = clone_mock(_session_template)
+        first.__aenter__.return_value = sentinel.FIRST
+        
+        # Assert
+        assert first.__aenter__ is not used_template_child
+        assert second.__aenter__ is not first.__aenter__
+        assert second.__aenter__.return_value is not sentinel.FIRST
+    
+    async def test_clone_does_not_share_call_history(self, mock_session, _session_template):
+        """Test that awaited methods on one clone are not recorded on another"""
+        # Arrange
+        other_session = clone_mock(_session_template)
+        
+        # Act
+        await mock_session.commit()
+        
+        # Assert
+        mock_session.commit.assert_awaited_once()
+        other_session.commit.assert_not_awaited()
@@ -1,5 +1,7 @@
+import dataclasses
 import pytest
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from unittest.mock import patch
 from src.factories.reminder_factory import ReminderFactory
 from src.models.reminder import Reminder
@@ -7,6 +9,46 @@ from src.models.enums import FrequencyEnum, ReminderStatus
 from src.strategies.frequency_strategy import get_frequency_strategy
 
 
+# Complete reminder payload for create_from_dict; the factory only reads it
+_FULL_REMINDER_DICT = MappingProxyType({
+    "user_id": "123456789",
+    "guild_id": "987654321",
+    "channel_id": "111222333",
+    "frequency": FrequencyEnum.WEEKLY,
+    "message_content": "Weekly team meeting",
+    "created_by": "admin_456",
+    "validation_required": False,
+    "status": ReminderStatus.ACTIVE,
+    "reminder_id": 100,
+    "next_execution": datetime(2024, 6, 20, 9, 0, 0),
+    "created_at": datetime(2024, 6, 15, 10, 0, 0),
+    "updated_at": datetime(2024, 6, 15, 10, 0, 0)
+})
+
+
+@dataclasses.dataclass(frozen=True)
+class ReminderSpec:
+    """Immutable reminder creation arguments, unpacked with ``**vars(spec)``"""
+    user_id: str
+    guild_id: str
+    channel_id: str
+    frequency: FrequencyEnum
+    message_content: str
+    created_by: str
+    validation_required: bool = False
+
+
+_BASE_SPEC = ReminderSpec(
+    user_id="123456789",
+    guild_id="987654321",
+    channel_id="111222333",
+    frequency=FrequencyEnum.DAILY,
+    message_content="Daily standup reminder",
+    created_by="admin_123",
+    validation_required=True
+)
+
+
 class TestReminderFactory:
     """Test cases for the ReminderFactory"""
     
@@ -15,18 +57,10 @@ class TestReminderFactory:
         """Create a reminder factory instance"""
         return ReminderFactory()
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def base_reminder_data(self):
-        """Base reminder creation data"""
-        return {
-            "user_id": "123456789",
-            "guild_id": "987654321",
-            "channel_id": "111222333",
-            "frequency": FrequencyEnum.DAILY,
-            "message_content": "Daily standup reminder",
-            "created_by": "admin_123",
-            "validation_required": True
-        }
+        """Base reminder creation data (read-only; tests merge overrides into a new dict)"""
+        return MappingProxyType(dataclasses.asdict(_BASE_SPEC))
     
     def test_create_reminder_with_all_fields(self, reminder_factory, base_reminder_data):
         """Test creating reminder with all required fields"""
@@ -48,59 +82,61 @@ class TestReminderFactory:
         """Test creating reminder with custom next execution time"""
         # Arrange
         custom_time = datetime(2024, 6, 15, 14, 30, 0)
-        base_reminder_data["next_execution"] = custom_time
+        reminder_data = {**base_reminder_data, "next_execution": custom_time}
         
         # Act
-        reminder = reminder_factory.create_reminder(**base_reminder_data)
+        reminder = reminder_factory.create_reminder(**reminder_data)
         
         # Assert
         assert reminder.next_execution == custom_time
     
-    def test_create_reminder_calculates_next_execution_automatically(self, reminder_factory, base_reminder_data):
+    @pytest.fixture
+    def fixed_utcnow(self, monkeypatch):
+        """Freeze the factory's clock at a fixed instant"""
+        fixed_time = datetime(2024, 6, 15, 10, 0, 0)
+        
+        class _FrozenDatetime(datetime):
+            @classmethod
+            def utcnow(cls):
+                return fixed_time
+        
+        monkeypatch.setattr('src.factories.reminder_factory.datetime', _FrozenDatetime)
+        return fixed_time
+    
+    def test_create_reminder_calculates_next_execution_automatically(self, reminder_factory, base_reminder_data, fixed_utcnow):
         """Test that next execution is calculated automatically when not provided"""
-        # Arrange
-        with patch('src.factories.reminder_factory.datetime') as mock_datetime:
-            fixed_time = datetime(2024, 6, 15, 10, 0, 0)
-            mock_datetime.utcnow.return_value = fixed_time
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-            
-            # Act
-            reminder = reminder_factory.create_reminder(**base_reminder_data)
-            
-            # Assert
-            # For daily frequency, should be current time + 1 day
-            expected_next = fixed_time + timedelta(days=1)
-            assert reminder.next_execution == expected_next
+        # Act
+        reminder = reminder_factory.create_reminder(**base_reminder_data)
+        
+        # Assert
+        # For daily frequency, should be current time + 1 day
+        expected_next = fixed_utcnow + timedelta(days=1)
+        assert reminder.next_execution == expected_next
     
-    def test_create_reminder_different_frequencies(self, reminder_factory, base_reminder_data):
+    @pytest.mark.parametrize("frequency,expected_delta", [
+        (FrequencyEnum.HOURLY, timedelta(hours=1)),
+        (FrequencyEnum.DAILY, timedelta(days=1)),
+        (FrequencyEnum.WEEKLY, timedelta(weeks=1)),
+    ])
+    def test_create_reminder_different_frequencies(
+        self, reminder_factory, fixed_utcnow, frequency, expected_delta
+    ):
         """Test creating reminders with different frequencies"""
-        frequencies = [
-            (FrequencyEnum.HOURLY, timedelta(hours=1)),
-            (FrequencyEnum.DAILY, timedelta(days=1)),
-            (FrequencyEnum.WEEKLY, timedelta(weeks=1)),
-        ]
+        # Arrange
+        spec = dataclasses.replace(_BASE_SPEC, frequency=frequency)
         
-        with patch('src.factories.reminder_factory.datetime') as mock_datetime:
-            fixed_time = datetime(2024, 6, 15, 10, 0, 0)
-            mock_datetime.utcnow.return_value = fixed_time
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-            
-            for frequency, expected_delta in frequencies:
-                # Arrange
-                base_reminder_data["frequency"] = frequency
-                
-                # Act
-                reminder = reminder_factory.create_reminder(**base_reminder_data)
-                
-                # Assert
-                expected_next = fixed_time + expected_delta
-                assert reminder.next_execution == expected_next
-                assert reminder.frequency == frequency
+        # Act
+        reminder = reminder_factory.create_reminder(**vars(spec))
+        
+        # Assert
+        expected_next = fixed_utcnow + expected_delta
+        assert reminder.next_execution == expected_next
+        assert reminder.frequency == frequency
     
     def test_create_reminder_monthly_frequency(self, reminder_factory, base_reminder_data):
         """Test creating reminder with monthly frequency"""
         # Arrange
-        base_reminder_data["frequency"] = FrequencyEnum.MONTHLY
+        reminder_data = {**base_reminder_data, "frequency": FrequencyEnum.MONTHLY}
         
         with patch('src.factories.reminder_factory.datetime') as mock_datetime:
             # January 15th should go to February 15th
@@ -109,7 +145,7 @@ class TestReminderFactory:
             mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
             
             # Act
-            reminder = reminder_factory.create_reminder(**base_reminder_data)
+            reminder = reminder_factory.create_reminder(**reminder_data)
             
             # Assert
             expected_next = datetime(2024, 2, 15, 10, 0, 0)
@@ -119,10 +155,10 @@ class TestReminderFactory:
     def test_create_reminder_validation_not_required(self, reminder_factory, base_reminder_data):
         """Test creating reminder without validation requirement"""
         # Arrange
-        base_reminder_data["validation_required"] = False
+        reminder_data = {**base_reminder_data, "validation_required": False}
         
         # Act
-        reminder = reminder_factory.create_reminder(**base_reminder_data)
+        reminder = reminder_factory.create_reminder(**reminder_data)
         
         # Assert
         assert reminder.validation_required is False
@@ -130,10 +166,10 @@ class TestReminderFactory:
     def test_create_reminder_with_custom_status(self, reminder_factory, base_reminder_data):
         """Test creating reminder with custom status"""
         # Arrange
-        base_reminder_data["status"] = ReminderStatus.PAUSED
+        reminder_data = {**base_reminder_data, "status": ReminderStatus.PAUSED}
         
         # Act
-        reminder = reminder_factory.create_reminder(**base_reminder_data)
+        reminder = reminder_factory.create_reminder(**reminder_data)
         
         # Assert
         assert reminder.status == ReminderStatus.PAUSED
@@ -141,10 +177,10 @@ class TestReminderFactory:
     def test_create_reminder_with_reminder_id(self, reminder_factory, base_reminder_data):
         """Test creating reminder with specific ID"""
         # Arrange
-        base_reminder_data["reminder_id"] = 42
+        reminder_data = {**base_reminder_data, "reminder_id": 42}
         
         # Act
-        reminder = reminder_factory.create_reminder(**base_reminder_data)
+        reminder = reminder_factory.create_reminder(**reminder_data)
         
         # Assert
         assert reminder.id == 42
@@ -155,21 +191,22 @@ class TestReminderFactory:
         reminder = reminder_factory.create_reminder(**base_reminder_data)
         
         # Assert
-        assert reminder.created_at is not None
-        assert reminder.updated_at is not None
-        assert isinstance(reminder.created_at, datetime)
-        assert isinstance(reminder.updated_at, datetime)
+        assert type(reminder.created_at) is datetime
+        assert type(reminder.updated_at) is datetime
     
     def test_create_reminder_with_custom_timestamps(self, reminder_factory, base_reminder_data):
         """Test creating reminder with custom timestamps"""
         # Arrange
         custom_created = datetime(2024, 1, 1, 12, 0, 0)
         custom_updated = datetime(2024, 1, 2, 12, 0, 0)
-        base_reminder_data["created_at"] = custom_created
-        base_reminder_data["updated_at"] = custom_updated
+        reminder_data = {
+            **base_reminder_data,
+            "created_at": custom_created,
+            "updated_at": custom_updated
+        }
         
         # Act
-        reminder = reminder_factory.create_reminder(**base_reminder_data)
+        reminder = reminder_factory.create_reminder(**reminder_data)
         
         # Assert
         assert reminder.created_at == custom_created
@@ -177,24 +214,8 @@ class TestReminderFactory:
     
     def test_create_from_dict_full_data(self, reminder_factory):
         """Test creating reminder from dictionary with full data"""
-        # Arrange
-        reminder_dict = {
-            "user_id": "123456789",
-            "guild_id": "987654321", 
-            "channel_id": "111222333",
-            "frequency": FrequencyEnum.WEEKLY,
-            "message_content": "Weekly team meeting",
-            "created_by": "admin_456",
-            "validation_required": False,
-            "status": ReminderStatus.ACTIVE,
-            "reminder_id": 100,
-            "next_execution": datetime(2024, 6, 20, 9, 0, 0),
-            "created_at": datetime(2024, 6, 15, 10, 0, 0),
-            "updated_at": datetime(2024, 6, 15, 10, 0, 0)
-        }
-        
         # Act
-        reminder = reminder_factory.create_from_dict(reminder_dict)
+        reminder = reminder_factory.create_from_dict(_FULL_REMINDER_DICT)
         
         # Assert
         assert reminder.user_id == "123456789"
@@ -238,43 +259,43 @@ class TestReminderFactory:
     def test_create_reminder_invalid_frequency(self, reminder_factory, base_reminder_data):
         """Test creating reminder with invalid frequency"""
         # Arrange
-        base_reminder_data["frequency"] = "INVALID_FREQUENCY"
+        reminder_data = {**base_reminder_data, "frequency": "INVALID_FREQUENCY"}
         
         # Act & Assert
         with pytest.raises(ValueError):
-            reminder_factory.create_reminder(**base_reminder_data)
+            reminder_factory.create_reminder(**reminder_data)
     
     def test_create_reminder_empty_message_content(self, reminder_factory, base_reminder_data):
         """Test creating reminder with empty message content"""
         # Arrange
-        base_reminder_data["message_content"] = ""
+        reminder_data = {**base_reminder_data, "message_content": ""}
         
         # Act & Assert
         with pytest.raises(ValueError, match="Message content cannot be empty"):
-            reminder_factory.create_reminder(**base_reminder_data)
+            reminder_factory.create_reminder(**reminder_data)
     
     def test_create_reminder_none_message_content(self, reminder_factory, base_reminder_data):
         """Test creating reminder with None message content"""
         # Arrange
-        base_reminder_data["message_content"] = None
+        reminder_data = {**base_reminder_data, "message_content": None}
         
         # Act & Assert
         with pytest.raises(ValueError, match="Message content cannot be empty"):
-            reminder_factory.create_reminder(**base_reminder_data)
+            reminder_factory.create_reminder(**reminder_data)
     
     def test_create_reminder_whitespace_message_content(self, reminder_factory, base_reminder_data):
         """Test creating reminder with whitespace-only message content"""
         # Arrange
-        base_reminder_data["message_content"] = "   \n\t   "
+        reminder_data = {**base_reminder_data, "message_content": "   \n\t   "}
         
         # Act & Assert
         with pytest.raises(ValueError, match="Message content cannot be empty"):
-            reminder_factory.create_reminder(**base_reminder_data)
+            reminder_factory.create_reminder(**reminder_data)
     
     def test_factory_uses_frequency_strategy(self, reminder_factory, base_reminder_data):
         """Test that factory uses frequency strategy for calculation"""
         # Arrange
-        base_reminder_data["frequency"] = FrequencyEnum.HOURLY
+        reminder_data = {**base_reminder_data, "frequency": FrequencyEnum.HOURLY}
         
         with patch('src.factories.reminder_factory.get_frequency_strategy') as mock_get_strategy:
             mock_strategy = mock_get_strategy.return_value
@@ -282,7 +303,7 @@ class TestReminderFactory:
             mock_strategy.calculate_next_execution.return_value = expected_time
             
             # Act
-            reminder = reminder_factory.create_reminder(**base_reminder_data)
+            reminder = reminder_factory.create_reminder(**reminder_data)
             
             # Assert
             mock_get_strategy.assert_called_once_with(FrequencyEnum.HOURLY)
@@ -292,27 +313,27 @@ class TestReminderFactory:
     def test_bulk_create_reminders(self, reminder_factory):
         """Test creating multiple reminders in bulk"""
         # Arrange
-        reminder_dicts = [
-            {
-                "user_id": "user1",
-                "guild_id": "guild1",
-                "channel_id": "channel1",
-                "frequency": FrequencyEnum.DAILY,
-                "message_content": "Reminder 1",
-                "created_by": "admin1"
-            },
-            {
-                "user_id": "user2",
-                "guild_id": "guild1", 
-                "channel_id": "channel1",
-                "frequency": FrequencyEnum.WEEKLY,
-                "message_content": "Reminder 2",
-                "created_by": "admin1"
-            }
+        specs = [
+            ReminderSpec(
+                user_id="user1",
+                guild_id="guild1",
+                channel_id="channel1",
+                frequency=FrequencyEnum.DAILY,
+                message_content="Reminder 1",
+                created_by="admin1"
+            ),
+            ReminderSpec(
+                user_id="user2",
+                guild_id="guild1",
+                channel_id="channel1",
+                frequency=FrequencyEnum.WEEKLY,
+                message_content="Reminder 2",
+                created_by="admin1"
+            )
         ]
         
         # Act
-        reminders = reminder_factory.bulk_create_reminders(reminder_dicts)
+        reminders = reminder_factory.bulk_create_reminders([vars(spec) for spec in specs])
         
         # Assert
         assert len(reminders) == 2
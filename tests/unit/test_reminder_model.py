@@ -27,7 +27,7 @@ class TestReminder:
         assert reminder.status == ReminderStatus.ACTIVE
         assert reminder.validation_required is False
         assert reminder.next_execution is not None
-        assert isinstance(reminder.created_at, datetime)
+        assert type(reminder.created_at) is datetime
     
     def test_create_reminder_with_validation_required(self):
         """Test creating a reminder that requires validation"""
@@ -1,91 +1,65 @@
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.util import identity_key
 from src.repositories.reminder_repo import ReminderRepository
 from src.database.models import ReminderModel
 from src.models.enums import ReminderStatus, FrequencyEnum
+from tests.unit.helpers import where_columns
+
+
+_NOW = datetime(2024, 1, 1)
+_TOMORROW = _NOW + timedelta(days=1)
+
+
+def _from_tables(statement):
+    """Tables the statement selects from, to catch accidental joins"""
+    return statement.get_final_froms()
 
 
 class TestReminderRepository:
     """Test cases for the ReminderRepository"""
     
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock async session"""
-        session = AsyncMock(spec=AsyncSession)
-        return session
-    
     @pytest.fixture
     def repository(self, mock_session):
         """Create a reminder repository instance"""
         return ReminderRepository(mock_session)
     
     @pytest.fixture
-    def sample_reminder_model(self):
-        """Create a sample reminder model for testing"""
-        return ReminderModel(
-            id=1,
-            user_id="123456789",
-            guild_id="987654321",
-            channel_id="111222333",
-            frequency=FrequencyEnum.DAILY,
-            message_content="Test reminder",
-            validation_required=True,
-            status=ReminderStatus.ACTIVE,
-            created_by="admin_123",
-            next_execution=datetime.utcnow() + timedelta(days=1)
-        )
-    
-    @pytest.mark.asyncio
-    async def test_find_by_user_id(self, repository, mock_session, sample_reminder_model):
-        """Test finding reminders by user ID"""
-        # Arrange
-        user_id = "123456789"
-        expected_reminders = [sample_reminder_model]
-        
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = expected_reminders
-        mock_session.execute.return_value = mock_result
-        
-        # Act
-        result = await repository.find_by_user_id(user_id)
-        
-        # Assert
-        assert result == expected_reminders
-        mock_session.execute.assert_called_once()
-        
-        # Verify the query was built correctly
-        call_args = mock_session.execute.call_args[0][0]
-        assert "user_id" in str(call_args)
+    def stub_repository(self, stub_session):
+        """Create a reminder repository backed by the stub session"""
+        return ReminderRepository(stub_session)
     
-    @pytest.mark.asyncio
-    async def test_find_by_guild_id(self, repository, mock_session, sample_reminder_model):
-        """Test finding reminders by guild ID"""
+    @pytest.mark.parametrize("method,args,columns", [
+        ("find_by_user_id", ("123456789",), {"user_id"}),
+        ("find_by_guild_id", ("987654321",), {"guild_id"}),
+        ("find_by_frequency", (FrequencyEnum.DAILY,), {"frequency"}),
+        ("find_active_reminders", (), {"status"}),
+        ("find_requiring_validation", (), {"validation_required", "status"}),
+    ])
+    async def test_find_methods(self, stub_repository, stub_session, sample_reminder_model, method, args, columns):
+        """Test single-column finder queries"""
         # Arrange
-        guild_id = "987654321"
         expected_reminders = [sample_reminder_model]
         
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = expected_reminders
-        mock_session.execute.return_value = mock_result
+        stub_session.returns(expected_reminders)
         
         # Act
-        result = await repository.find_by_guild_id(guild_id)
+        result = await getattr(stub_repository, method)(*args)
         
         # Assert
         assert result == expected_reminders
-        mock_session.execute.assert_called_once()
+        assert len(stub_session.statements) == 1
         
-        # Verify the query was built correctly
-        call_args = mock_session.execute.call_args[0][0]
-        assert "guild_id" in str(call_args)
+        # Verify the query filters on exactly the expected columns
+        statement = stub_session.statements[0]
+        assert where_columns(statement) == columns
+        assert _from_tables(statement) == [ReminderModel.__table__]
     
-    @pytest.mark.asyncio
-    async def test_find_due_reminders(self, repository, mock_session):
+    async def test_find_due_reminders(self, stub_repository, stub_session):
         """Test finding reminders that are due for execution"""
         # Arrange
-        current_time = datetime.utcnow()
+        current_time = _NOW
         due_reminder = ReminderModel(
             id=1,
             next_execution=current_time - timedelta(minutes=5),
@@ -93,80 +67,48 @@ class TestReminderRepository:
         )
         expected_reminders = [due_reminder]
         
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = expected_reminders
-        mock_session.execute.return_value = mock_result
+        stub_session.returns(expected_reminders)
         
         # Act
-        result = await repository.find_due_reminders(current_time)
+        result = await stub_repository.find_due_reminders(current_time)
         
         # Assert
         assert result == expected_reminders
-        mock_session.execute.assert_called_once()
+        assert len(stub_session.statements) == 1
         
         # Verify the query filters for due reminders
-        call_args = mock_session.execute.call_args[0][0]
-        query_str = str(call_args)
-        assert "next_execution" in query_str
-        assert "status" in query_str
-    
-    @pytest.mark.asyncio
-    async def test_find_active_reminders(self, repository, mock_session, sample_reminder_model):
-        """Test finding active reminders"""
-        # Arrange
-        sample_reminder_model.status = ReminderStatus.ACTIVE
-        expected_reminders = [sample_reminder_model]
-        
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = expected_reminders
-        mock_session.execute.return_value = mock_result
-        
-        # Act
-        result = await repository.find_active_reminders()
-        
-        # Assert
-        assert result == expected_reminders
-        mock_session.execute.assert_called_once()
-        
-        # Verify the query filters for active status
-        call_args = mock_session.execute.call_args[0][0]
-        assert "status" in str(call_args)
+        statement = stub_session.statements[0]
+        assert where_columns(statement) == {"next_execution", "status"}
+        assert _from_tables(statement) == [ReminderModel.__table__]
     
-    @pytest.mark.asyncio
-    async def test_find_by_user_and_guild(self, repository, mock_session, sample_reminder_model):
+    async def test_find_by_user_and_guild(self, stub_repository, stub_session, sample_reminder_model):
         """Test finding reminders by both user ID and guild ID"""
         # Arrange
         user_id = "123456789"
         guild_id = "987654321"
         expected_reminders = [sample_reminder_model]
         
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = expected_reminders
-        mock_session.execute.return_value = mock_result
+        stub_session.returns(expected_reminders)
         
         # Act
-        result = await repository.find_by_user_and_guild(user_id, guild_id)
+        result = await stub_repository.find_by_user_and_guild(user_id, guild_id)
         
         # Assert
         assert result == expected_reminders
-        mock_session.execute.assert_called_once()
+        assert len(stub_session.statements) == 1
         
         # Verify the query filters for both user_id and guild_id
-        call_args = mock_session.execute.call_args[0][0]
-        query_str = str(call_args)
-        assert "user_id" in query_str
-        assert "guild_id" in query_str
+        statement = stub_session.statements[0]
+        assert where_columns(statement) == {"user_id", "guild_id"}
+        assert _from_tables(statement) == [ReminderModel.__table__]
     
-    @pytest.mark.asyncio
-    async def test_count_by_user_id(self, repository, mock_session):
+    async def test_count_by_user_id(self, repository, mock_session, result_with):
         """Test counting reminders by user ID"""
         # Arrange
         user_id = "123456789"
         expected_count = 3
         
-        mock_result = MagicMock()
-        mock_result.scalar.return_value = expected_count
-        mock_session.execute.return_value = mock_result
+        mock_session.execute.return_value = result_with([expected_count])
         
         # Act
         result = await repository.count_by_user_id(user_id)
@@ -177,42 +119,16 @@ class TestReminderRepository:
         
         # Verify the query filters by user_id
         call_args = mock_session.execute.call_args[0][0]
-        assert "user_id" in str(call_args)
+        assert where_columns(call_args) == {"user_id"}
+        assert _from_tables(call_args) == [ReminderModel.__table__]
     
-    @pytest.mark.asyncio
-    async def test_find_requiring_validation(self, repository, mock_session):
-        """Test finding reminders that require validation"""
-        # Arrange
-        validation_reminder = ReminderModel(
-            id=1,
-            validation_required=True,
-            status=ReminderStatus.ACTIVE
-        )
-        expected_reminders = [validation_reminder]
-        
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = expected_reminders
-        mock_session.execute.return_value = mock_result
-        
-        # Act
-        result = await repository.find_requiring_validation()
-        
-        # Assert
-        assert result == expected_reminders
-        mock_session.execute.assert_called_once()
-        
-        # Verify the query filters for validation_required
-        call_args = mock_session.execute.call_args[0][0]
-        assert "validation_required" in str(call_args)
-    
-    @pytest.mark.asyncio
-    async def test_update_status(self, repository, mock_session, sample_reminder_model):
+    async def test_update_status(self, repository, mock_session, mutable_reminder_model):
         """Test updating reminder status"""
         # Arrange
         reminder_id = 1
         new_status = ReminderStatus.PAUSED
         
-        mock_session.get.return_value = sample_reminder_model
+        mock_session.get.return_value = mutable_reminder_model
         mock_session.commit.return_value = None
         
         # Act
@@ -220,11 +136,10 @@ class TestReminderRepository:
         
         # Assert
         assert result is True
-        assert sample_reminder_model.status == new_status
+        assert mutable_reminder_model.status == new_status
         mock_session.get.assert_called_once_with(ReminderModel, reminder_id)
         mock_session.commit.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_update_status_not_found(self, repository, mock_session):
         """Test updating status of non-existing reminder"""
         # Arrange
@@ -241,14 +156,13 @@ class TestReminderRepository:
         mock_session.get.assert_called_once_with(ReminderModel, reminder_id)
         mock_session.commit.assert_not_called()
     
-    @pytest.mark.asyncio
-    async def test_update_next_execution(self, repository, mock_session, sample_reminder_model):
+    async def test_update_next_execution(self, repository, mock_session, mutable_reminder_model):
         """Test updating next execution time"""
         # Arrange
         reminder_id = 1
-        new_execution_time = datetime.utcnow() + timedelta(days=2)
+        new_execution_time = _TOMORROW + timedelta(days=1)
         
-        mock_session.get.return_value = sample_reminder_model
+        mock_session.get.return_value = mutable_reminder_model
         mock_session.commit.return_value = None
         
         # Act
@@ -256,28 +170,64 @@ class TestReminderRepository:
         
         # Assert
         assert result is True
-        assert sample_reminder_model.next_execution == new_execution_time
+        assert mutable_reminder_model.next_execution == new_execution_time
         mock_session.get.assert_called_once_with(ReminderModel, reminder_id)
         mock_session.commit.assert_called_once()
     
-    @pytest.mark.asyncio
-    async def test_find_by_frequency(self, repository, mock_session, sample_reminder_model):
-        """Test finding reminders by frequency"""
+    async def test_bulk_update_next_executions(self, repository, mock_session, mutable_reminder_model, result_with):
+        """Test updating next execution times in one statement"""
         # Arrange
-        frequency = FrequencyEnum.DAILY
-        expected_reminders = [sample_reminder_model]
-        
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = expected_reminders
-        mock_session.execute.return_value = mock_result
+        updates = [(1, datetime(2024, 1, 2)), (2, datetime(2024, 1, 8))]
+        mock_session.execute.return_value = result_with(rowcount=2)
+        mock_session.identity_map = {identity_key(ReminderModel, 1): mutable_reminder_model}
         
         # Act
-        result = await repository.find_by_frequency(frequency)
+        result = await repository.bulk_update_next_executions(updates)
         
         # Assert
-        assert result == expected_reminders
+        assert result == 2
         mock_session.execute.assert_called_once()
+        rows = mock_session.execute.call_args[0][1]
+        assert [(row["b_id"], row["b_next"]) for row in rows] == updates
+        mock_session.commit.assert_called_once()
         
-        # Verify the query filters by frequency
-        call_args = mock_session.execute.call_args[0][0]
-        assert "frequency" in str(call_args)
\ No newline at end of file
+        # The reminder already loaded in the session sees the new time
+        assert mutable_reminder_model.next_execution == datetime(2024, 1, 2)
+    
+    async def test_bulk_update_next_executions_missing_row(self, repository, mock_session, result_with):
+        """Test that a reminder deleted since it was loaded is skipped, not fatal"""
+        # Arrange
+        updates = [(1, datetime(2024, 1, 2)), (999, datetime(2024, 1, 8))]
+        mock_session.execute.return_value = result_with(rowcount=1)
+        mock_session.identity_map = {}
+        
+        # Act
+        result = await repository.bulk_update_next_executions(updates)
+        
+        # Assert
+        assert result == 1
+        mock_session.commit.assert_called_once()
+        mock_session.rollback.assert_not_called()
+    
+    async def test_bulk_update_next_executions_failure_rolls_back(self, repository, mock_session):
+        """Test that a failed bulk update rolls the session back and re-raises"""
+        # Arrange
+        updates = [(1, datetime(2024, 1, 2))]
+        mock_session.execute.side_effect = SQLAlchemyError("database is locked")
+        
+        # Act / Assert
+        with pytest.raises(SQLAlchemyError):
+            await repository.bulk_update_next_executions(updates)
+        
+        mock_session.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
+    
+    async def test_bulk_update_next_executions_empty(self, repository, mock_session):
+        """Test bulk update with nothing to update"""
+        # Act
+        result = await repository.bulk_update_next_executions([])
+        
+        # Assert
+        assert result == 0
+        mock_session.execute.assert_not_called()
+        mock_session.commit.assert_not_called()
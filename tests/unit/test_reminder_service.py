@@ -2,35 +2,19 @@ import pytest
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from src.services.reminder_service import ReminderService
-from src.repositories.reminder_repo import ReminderRepository
-from src.repositories.validation_repo import ValidationRepository
-from src.database.models import ReminderModel, ValidationModel
+from src.database.models import ReminderModel
 from src.models.reminder import Reminder
 from src.models.validation import Validation
 from src.models.enums import ReminderStatus, ValidationStatus, FrequencyEnum
 
 
+_NOW = datetime(2024, 1, 1)
+_TOMORROW = _NOW + timedelta(days=1)
+
+
 class TestReminderService:
     """Test cases for the ReminderService"""
     
-    @pytest.fixture
-    def mock_reminder_repo(self):
-        """Create a mock reminder repository"""
-        return AsyncMock(spec=ReminderRepository)
-    
-    @pytest.fixture
-    def mock_validation_repo(self):
-        """Create a mock validation repository"""
-        return AsyncMock(spec=ValidationRepository)
-    
-    @pytest.fixture
-    def mock_scheduler_service(self):
-        """Create a mock scheduler service"""
-        scheduler = AsyncMock()
-        scheduler.schedule_reminder = AsyncMock()
-        scheduler.unschedule_reminder = AsyncMock()
-        return scheduler
-    
     @pytest.fixture
     def reminder_service(self, mock_reminder_repo, mock_validation_repo, mock_scheduler_service):
         """Create a reminder service instance"""
@@ -40,20 +24,6 @@ class TestReminderService:
             scheduler_service=mock_scheduler_service
         )
     
-    @pytest.fixture
-    def sample_reminder_data(self):
-        """Sample reminder creation data"""
-        return {
-            "user_id": "123456789",
-            "guild_id": "987654321",
-            "channel_id": "111222333",
-            "frequency": FrequencyEnum.DAILY,
-            "message_content": "Daily standup reminder",
-            "validation_required": True,
-            "created_by": "admin_123"
-        }
-    
-    @pytest.mark.asyncio
     async def test_create_reminder_success(self, reminder_service, mock_reminder_repo, mock_scheduler_service, sample_reminder_data):
         """Test successful reminder creation"""
         # Arrange
@@ -63,9 +33,9 @@ class TestReminderService:
             id=1,
             **sample_reminder_data,
             status=ReminderStatus.ACTIVE,
-            next_execution=datetime.utcnow() + timedelta(days=1),
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            next_execution=_TOMORROW,
+            created_at=_NOW,
+            updated_at=_NOW
         )
         mock_reminder_repo.create.return_value = created_model
         
@@ -84,7 +54,6 @@ class TestReminderService:
         # Verify scheduler was called
         mock_scheduler_service.schedule_reminder.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_create_reminder_user_limit_exceeded(self, reminder_service, mock_reminder_repo, sample_reminder_data):
         """Test reminder creation when user has too many reminders"""
         # Arrange
@@ -97,17 +66,15 @@ class TestReminderService:
         # Verify no creation attempted
         mock_reminder_repo.create.assert_not_called()
     
-    @pytest.mark.asyncio
     async def test_create_reminder_invalid_message_content(self, reminder_service, sample_reminder_data):
         """Test reminder creation with invalid message content"""
         # Arrange
-        sample_reminder_data["message_content"] = ""  # Empty message
+        reminder_data = {**sample_reminder_data, "message_content": ""}  # Empty message
         
         # Act & Assert
         with pytest.raises(ValueError, match="Message content cannot be empty"):
-            await reminder_service.create_reminder(**sample_reminder_data)
+            await reminder_service.create_reminder(**reminder_data)
     
-    @pytest.mark.asyncio
     async def test_get_reminder_by_id_exists(self, reminder_service, mock_reminder_repo):
         """Test getting reminder by ID when it exists"""
         # Arrange
@@ -133,7 +100,6 @@ class TestReminderService:
         assert result.user_id == "123456789"
         mock_reminder_repo.get_by_id.assert_called_once_with(reminder_id)
     
-    @pytest.mark.asyncio
     async def test_get_reminder_by_id_not_found(self, reminder_service, mock_reminder_repo):
         """Test getting reminder by ID when it doesn't exist"""
         # Arrange
@@ -147,7 +113,6 @@ class TestReminderService:
         assert result is None
         mock_reminder_repo.get_by_id.assert_called_once_with(reminder_id)
     
-    @pytest.mark.asyncio
     async def test_get_user_reminders(self, reminder_service, mock_reminder_repo):
         """Test getting all reminders for a user"""
         # Arrange
@@ -162,7 +127,7 @@ class TestReminderService:
                 message_content="Reminder 1",
                 created_by="admin_123",
                 status=ReminderStatus.ACTIVE,
-                next_execution=datetime.utcnow() + timedelta(days=1)
+                next_execution=_TOMORROW
             ),
             ReminderModel(
                 id=2, 
@@ -173,7 +138,7 @@ class TestReminderService:
                 message_content="Reminder 2",
                 created_by="admin_123",
                 status=ReminderStatus.ACTIVE,
-                next_execution=datetime.utcnow() + timedelta(weeks=1)
+                next_execution=_NOW + timedelta(weeks=1)
             )
         ]
         mock_reminder_repo.find_by_user_id.return_value = mock_models
@@ -186,7 +151,6 @@ class TestReminderService:
         assert all(r.user_id == user_id for r in result)
         mock_reminder_repo.find_by_user_id.assert_called_once_with(user_id)
     
-    @pytest.mark.asyncio
     async def test_update_reminder_status_success(self, reminder_service, mock_reminder_repo, mock_scheduler_service):
         """Test successful reminder status update"""
         # Arrange
@@ -205,7 +169,6 @@ class TestReminderService:
         if new_status == ReminderStatus.PAUSED:
             mock_scheduler_service.unschedule_reminder.assert_called_once_with(reminder_id)
     
-    @pytest.mark.asyncio
     async def test_update_reminder_status_resume(self, reminder_service, mock_reminder_repo, mock_scheduler_service):
         """Test resuming a paused reminder"""
         # Arrange
@@ -222,7 +185,7 @@ class TestReminderService:
             message_content="Test reminder",
             created_by="admin_123",
             status=ReminderStatus.ACTIVE,
-            next_execution=datetime.utcnow() + timedelta(days=1)
+            next_execution=_TOMORROW
         )
         mock_reminder_repo.get_by_id.return_value = mock_model
         
@@ -236,13 +199,12 @@ class TestReminderService:
         # When activating, should reschedule
         mock_scheduler_service.schedule_reminder.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_delete_reminder_success(self, reminder_service, mock_reminder_repo, mock_validation_repo, mock_scheduler_service):
         """Test successful reminder deletion"""
         # Arrange
         reminder_id = 1
         mock_reminder_repo.delete.return_value = True
-        mock_validation_repo.find_by_reminder_id.return_value = []
+        mock_validation_repo.bulk_delete_by_reminder_id.return_value = 0
         
         # Act
         result = await reminder_service.delete_reminder(reminder_id)
@@ -252,17 +214,11 @@ class TestReminderService:
         mock_scheduler_service.unschedule_reminder.assert_called_once_with(reminder_id)
         mock_reminder_repo.delete.assert_called_once_with(reminder_id)
     
-    @pytest.mark.asyncio
     async def test_delete_reminder_with_validations(self, reminder_service, mock_reminder_repo, mock_validation_repo, mock_scheduler_service):
         """Test deleting reminder that has associated validations"""
         # Arrange
         reminder_id = 1
-        mock_validations = [
-            ValidationModel(id=1, reminder_id=reminder_id),
-            ValidationModel(id=2, reminder_id=reminder_id)
-        ]
-        mock_validation_repo.find_by_reminder_id.return_value = mock_validations
-        mock_validation_repo.delete.return_value = True
+        mock_validation_repo.bulk_delete_by_reminder_id.return_value = 2
         mock_reminder_repo.delete.return_value = True
         
         # Act
@@ -271,12 +227,12 @@ class TestReminderService:
         # Assert
         assert result is True
         
-        # Should delete all validations first
-        assert mock_validation_repo.delete.call_count == 2
+        # Should delete all validations first, in a single bulk call
+        mock_validation_repo.bulk_delete_by_reminder_id.assert_called_once_with(reminder_id)
+        mock_validation_repo.delete.assert_not_called()
         mock_reminder_repo.delete.assert_called_once_with(reminder_id)
         mock_scheduler_service.unschedule_reminder.assert_called_once_with(reminder_id)
     
-    @pytest.mark.asyncio
     async def test_process_due_reminders(self, reminder_service, mock_reminder_repo):
         """Test processing due reminders"""
         # Arrange
@@ -297,7 +253,7 @@ class TestReminderService:
             )
         ]
         mock_reminder_repo.find_due_reminders.return_value = due_reminders
-        mock_reminder_repo.update_next_execution.return_value = True
+        mock_reminder_repo.bulk_update_next_executions.return_value = 2
         
         # Mock the notification service
         with patch.object(reminder_service, '_send_reminder_notification') as mock_send:
@@ -309,9 +265,35 @@ class TestReminderService:
             # Assert
             assert processed_count == 2
             assert mock_send.call_count == 2
-            assert mock_reminder_repo.update_next_execution.call_count == 2
+            mock_reminder_repo.bulk_update_next_executions.assert_called_once()
+            updates = mock_reminder_repo.bulk_update_next_executions.call_args[0][0]
+            assert [reminder_id for reminder_id, _ in updates] == [1, 2]
+            mock_reminder_repo.update_next_execution.assert_not_called()
+    
+    async def test_process_due_reminders_update_failure(self, reminder_service, mock_reminder_repo):
+        """Test that a failed bulk update is reported as nothing processed"""
+        # Arrange
+        due_reminders = [
+            ReminderModel(
+                id=1,
+                user_id="123456789",
+                message_content="Due reminder",
+                validation_required=False,
+                frequency=FrequencyEnum.DAILY
+            )
+        ]
+        mock_reminder_repo.find_due_reminders.return_value = due_reminders
+        mock_reminder_repo.bulk_update_next_executions.side_effect = Exception("database is locked")
+        
+        with patch.object(reminder_service, '_send_reminder_notification') as mock_send:
+            # Act
+            processed_count = await reminder_service.process_due_reminders()
+            
+            # Assert
+            assert processed_count == 0
+            assert mock_send.call_count == 1
+            mock_reminder_repo.bulk_update_next_executions.assert_called_once()
     
-    @pytest.mark.asyncio
     async def test_validate_reminder_permission_admin(self, reminder_service):
         """Test reminder permission validation for admin user"""
         # Arrange
@@ -324,7 +306,6 @@ class TestReminderService:
         # Assert
         assert result is True
     
-    @pytest.mark.asyncio
     async def test_validate_reminder_permission_no_admin(self, reminder_service):
         """Test reminder permission validation for non-admin user"""
         # Arrange
@@ -337,7 +318,6 @@ class TestReminderService:
         # Assert
         assert result is False
     
-    @pytest.mark.asyncio
     async def test_get_reminder_statistics(self, reminder_service, mock_reminder_repo, mock_validation_repo):
         """Test getting reminder statistics"""
         # Arrange
@@ -357,7 +337,6 @@ class TestReminderService:
         mock_reminder_repo.find_by_status.assert_called_once_with(ReminderStatus.ACTIVE)
         mock_validation_repo.count_by_status.assert_called_once_with(ValidationStatus.PENDING)
     
-    @pytest.mark.asyncio
     async def test_cleanup_old_reminders(self, reminder_service, mock_reminder_repo):
         """Test cleaning up old completed reminders"""
         # Arrange
@@ -365,17 +344,14 @@ class TestReminderService:
         mock_reminder_repo.cleanup_completed_reminders.return_value = 15
         
         # Act
-        with patch('src.services.reminder_service.datetime') as mock_datetime:
-            mock_datetime.utcnow.return_value = datetime(2024, 1, 31)
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-            
-            cleaned_count = await reminder_service.cleanup_old_reminders(cutoff_days)
+        cleaned_count = await reminder_service.cleanup_old_reminders(
+            cutoff_days, now=lambda: datetime(2024, 1, 31)
+        )
         
         # Assert
         assert cleaned_count == 15
-        mock_reminder_repo.cleanup_completed_reminders.assert_called_once()
+        mock_reminder_repo.cleanup_completed_reminders.assert_called_once_with(datetime(2024, 1, 1))
     
-    @pytest.mark.asyncio
     async def test_bulk_update_reminders(self, reminder_service, mock_reminder_repo, mock_scheduler_service):
         """Test bulk updating multiple reminders"""
         # Arrange
@@ -390,5 +366,6 @@ class TestReminderService:
         assert updated_count == 3
         mock_reminder_repo.bulk_update_status.assert_called_once_with(reminder_ids, new_status)
         
-        # Should unschedule all when pausing
-        assert mock_scheduler_service.unschedule_reminder.call_count == 3
\ No newline at end of file
+        # Should unschedule all when pausing, in a single call
+        mock_scheduler_service.bulk_unschedule.assert_called_once_with(reminder_ids)
+        mock_scheduler_service.unschedule_reminder.assert_not_called()
\ No newline at end of file
@@ -1,41 +1,126 @@
+import copy
+import contextvars
 import pytest
 import asyncio
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
 from src.services.scheduler_service import SchedulerService
 from src.models.reminder import Reminder
 from src.models.enums import FrequencyEnum, ReminderStatus
 
 
+def _fast_reminder(rid, frequency=FrequencyEnum.DAILY, next_execution=None, message_content="Test reminder"):
+    """Build a Reminder without running its constructor.
+    
+    Scheduling tests only need the attributes the scheduler reads, so this
+    skips input validation and the frequency strategy lookup.
+    """
+    now = datetime.utcnow()
+    reminder = object.__new__(Reminder)
+    reminder.id = rid
+    reminder.user_id = "123456789"
+    reminder.guild_id = "987654321"
+    reminder.channel_id = "111222333"
+    reminder.frequency = frequency
+    reminder.message_content = message_content
+    reminder.validation_required = False
+    reminder.status = ReminderStatus.ACTIVE
+    reminder.created_by = "admin_123"
+    reminder.created_at = now
+    reminder.updated_at = now
+    reminder.next_execution = next_execution or now + timedelta(hours=1)
+    return reminder
+
+
+class _CountingAsync:
+    """Async callable that counts calls, far cheaper than an AsyncMock"""
+    
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.side_effect = None
+        self.call_count = 0
+    
+    async def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+
+class _ExecutionRecorder(list):
+    """Stand-in for _execute_reminder that records executed reminders.
+    
+    Tests await wait_for() instead of sleeping until the dispatcher runs.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._done = asyncio.Event()
+    
+    async def __call__(self, reminder):
+        self.append(reminder)
+        self._done.set()
+    
+    async def wait_for(self, count, timeout=1.0):
+        """Wait until at least count reminders have been executed"""
+        while len(self) < count:
+            self._done.clear()
+            await asyncio.wait_for(self._done.wait(), timeout)
+
+
+class _StubReminderService:
+    """Reminder service stub exposing only what the scheduler calls"""
+    
+    def __init__(self):
+        self.process_due_reminders = _CountingAsync(return_value=3)
+
+
 class TestSchedulerService:
     """Test cases for the SchedulerService"""
     
     @pytest.fixture
     def mock_reminder_service(self):
-        """Create a mock reminder service"""
-        service = AsyncMock()
-        service.process_due_reminders = AsyncMock(return_value=3)
-        return service
+        """Create a stub reminder service"""
+        return _StubReminderService()
     
     @pytest.fixture
-    def scheduler_service(self, mock_reminder_service):
-        """Create a scheduler service instance"""
-        return SchedulerService(reminder_service=mock_reminder_service)
+    async def scheduler_service(self, mock_reminder_service):
+        """Create a scheduler service instance.
+        
+        All tests share one event loop, so the service is shut down on
+        teardown to keep its loop and dispatcher tasks from leaking into
+        the next test.
+        """
+        service = SchedulerService(reminder_service=mock_reminder_service)
+        yield service
+        await service.shutdown()
     
     @pytest.fixture
+    def executed(self, scheduler_service, monkeypatch):
+        """Replace reminder execution with a recorder; returns the executed reminders"""
+        executed = _ExecutionRecorder()
+        monkeypatch.setattr(scheduler_service, "_execute_reminder", executed)
+        return executed
+    
+    @pytest.fixture(scope="module")
     def sample_reminder(self):
-        """Create a sample reminder for testing"""
-        return Reminder(
-            user_id="123456789",
-            guild_id="987654321",
-            channel_id="111222333",
-            frequency=FrequencyEnum.DAILY,
-            message_content="Test reminder",
-            created_by="admin_123",
-            reminder_id=1
+        """Shared sample reminder; request mutable_reminder to modify it"""
+        return _fast_reminder(1, next_execution=datetime.utcnow() + timedelta(days=1))
+    
+    @pytest.fixture
+    def mutable_reminder(self, sample_reminder):
+        """Per-test copy of the shared sample reminder"""
+        return copy.copy(sample_reminder)
+    
+    @pytest.fixture(scope="module")
+    def second_reminder(self):
+        """Shared second reminder with a different ID and frequency"""
+        return _fast_reminder(
+            2,
+            FrequencyEnum.WEEKLY,
+            next_execution=datetime.utcnow() + timedelta(weeks=1),
+            message_content="Another reminder"
         )
     
-    @pytest.mark.asyncio
     async def test_start_scheduler(self, scheduler_service, mock_reminder_service):
         """Test starting the scheduler"""
         # Act
@@ -49,7 +134,6 @@ class TestSchedulerService:
         # Cleanup
         await scheduler_service.stop()
     
-    @pytest.mark.asyncio
     async def test_stop_scheduler(self, scheduler_service):
         """Test stopping the scheduler"""
         # Arrange
@@ -63,7 +147,6 @@ class TestSchedulerService:
         assert scheduler_service.is_running is False
         assert scheduler_service._task is None
     
-    @pytest.mark.asyncio
     async def test_schedule_reminder(self, scheduler_service, sample_reminder):
         """Test scheduling a reminder"""
         # Act
@@ -73,28 +156,21 @@ class TestSchedulerService:
         assert sample_reminder.id in scheduler_service._scheduled_reminders
         task_info = scheduler_service._scheduled_reminders[sample_reminder.id]
         assert task_info["reminder"] == sample_reminder
-        assert task_info["task"] is not None
+        assert (task_info["when"], task_info["seq"], sample_reminder.id) in scheduler_service._heap
+        assert scheduler_service._dispatcher is not None
     
-    @pytest.mark.asyncio
     async def test_schedule_reminder_already_scheduled(self, scheduler_service, sample_reminder):
         """Test scheduling a reminder that's already scheduled"""
         # Arrange
         await scheduler_service.schedule_reminder(sample_reminder)
-        original_task = scheduler_service._scheduled_reminders[sample_reminder.id]["task"]
         
         # Act
         await scheduler_service.schedule_reminder(sample_reminder)
         
-        # Wait a moment for cancellation to process
-        await asyncio.sleep(0.01)
-        
-        # Assert - should replace the existing task
-        assert sample_reminder.id in scheduler_service._scheduled_reminders
-        new_task = scheduler_service._scheduled_reminders[sample_reminder.id]["task"]
-        assert new_task != original_task
-        assert original_task.cancelled()
+        # Assert - should replace the existing entry, leaving the old one stale
+        assert scheduler_service.get_scheduled_count() == 1
+        assert len(scheduler_service._heap) == 2
     
-    @pytest.mark.asyncio
     async def test_unschedule_reminder(self, scheduler_service, sample_reminder):
         """Test unscheduling a reminder"""
         # Arrange
@@ -108,7 +184,6 @@ class TestSchedulerService:
         assert result is True
         assert sample_reminder.id not in scheduler_service._scheduled_reminders
     
-    @pytest.mark.asyncio
     async def test_unschedule_reminder_not_found(self, scheduler_service):
         """Test unscheduling a reminder that doesn't exist"""
         # Act
@@ -117,29 +192,119 @@ class TestSchedulerService:
         # Assert
         assert result is False
     
-    @pytest.mark.asyncio
-    async def test_reschedule_reminder(self, scheduler_service, sample_reminder):
-        """Test rescheduling a reminder"""
+    async def test_bulk_unschedule(self, scheduler_service, sample_reminder):
+        """Test unscheduling several reminders in one call"""
         # Arrange
         await scheduler_service.schedule_reminder(sample_reminder)
-        original_task = scheduler_service._scheduled_reminders[sample_reminder.id]["task"]
+        
+        # Act
+        result = await scheduler_service.bulk_unschedule([sample_reminder.id, 999])
+        
+        # Assert - unknown IDs are skipped
+        assert result == 1
+        assert scheduler_service.get_scheduled_count() == 0
+    
+    async def test_reschedule_reminder(self, scheduler_service, mutable_reminder):
+        """Test rescheduling a reminder"""
+        # Arrange
+        await scheduler_service.schedule_reminder(mutable_reminder)
+        original_when = scheduler_service._scheduled_reminders[mutable_reminder.id]["when"]
         
         new_execution_time = datetime.utcnow() + timedelta(hours=2)
-        sample_reminder.next_execution = new_execution_time
+        mutable_reminder.next_execution = new_execution_time
         
         # Act
-        await scheduler_service.reschedule_reminder(sample_reminder)
+        await scheduler_service.reschedule_reminder(mutable_reminder)
         
-        # Wait a moment for cancellation to process
-        await asyncio.sleep(0.01)
+        # Assert
+        assert mutable_reminder.id in scheduler_service._scheduled_reminders
+        new_when = scheduler_service._scheduled_reminders[mutable_reminder.id]["when"]
+        assert new_when < original_when
+    
+    async def test_unscheduled_reminder_is_not_executed(self, scheduler_service, mutable_reminder, executed):
+        """Test that a stale heap entry is skipped by the dispatcher"""
+        # Arrange
+        mutable_reminder.next_execution = datetime.utcnow() + timedelta(seconds=0.01)
+        await scheduler_service.schedule_reminder(mutable_reminder)
+        
+        # Act
+        await scheduler_service.unschedule_reminder(mutable_reminder.id)
+        await asyncio.sleep(0.05)
         
         # Assert
-        assert sample_reminder.id in scheduler_service._scheduled_reminders
-        new_task = scheduler_service._scheduled_reminders[sample_reminder.id]["task"]
-        assert new_task != original_task
-        assert original_task.cancelled()
+        assert executed == []
+        assert scheduler_service._heap == []
+    
+    async def test_reminders_due_together_all_execute(self, scheduler_service, executed):
+        """Test that reminders due at the same time are all executed"""
+        # Arrange
+        due_at = datetime.utcnow() + timedelta(seconds=0.01)
+        for reminder_id in (1, 2, 3):
+            await scheduler_service.schedule_reminder(
+                _fast_reminder(reminder_id, next_execution=due_at)
+            )
+        
+        # Act
+        await executed.wait_for(3)
+        
+        # Assert
+        assert sorted(reminder.id for reminder in executed) == [1, 2, 3]
+        assert scheduler_service.get_scheduled_count() == 0
+    
+    async def test_schedule_reminder_wakes_dispatcher_only_for_new_head(self, scheduler_service):
+        """Test that only a new earliest reminder wakes the idle dispatcher"""
+        # Arrange
+        def make_reminder(reminder_id, hours):
+            return _fast_reminder(
+                reminder_id, next_execution=datetime.utcnow() + timedelta(hours=hours)
+            )
+        
+        await scheduler_service.schedule_reminder(make_reminder(1, hours=2))
+        await asyncio.sleep(0)  # let the dispatcher arm its timer and go idle
+        
+        # Act / Assert - a later reminder leaves the dispatcher asleep
+        await scheduler_service.schedule_reminder(make_reminder(2, hours=3))
+        assert not scheduler_service._wake.is_set()
+        
+        # Act / Assert - an earlier reminder wakes it to re-arm the timer
+        await scheduler_service.schedule_reminder(make_reminder(3, hours=1))
+        assert scheduler_service._wake.is_set()
+    
+    async def test_schedule_reminder_converts_due_time_with_one_clock_reading(
+        self, scheduler_service, mutable_reminder, monkeypatch
+    ):
+        """Test that the loop-time due time comes from a single paired clock reading"""
+        # Arrange
+        utc_now = datetime(2024, 1, 1)
+        monkeypatch.setattr(scheduler_service, "_now", lambda: (1000.0, utc_now))
+        mutable_reminder.next_execution = utc_now + timedelta(minutes=5)
+        
+        # Act
+        await scheduler_service.schedule_reminder(mutable_reminder)
+        
+        # Assert
+        task_info = scheduler_service._scheduled_reminders[mutable_reminder.id]
+        assert task_info["when"] == 1300.0
+    
+    async def test_unschedule_compacts_mostly_stale_heap(self, scheduler_service):
+        """Test that stale heap entries are dropped once they dominate the heap"""
+        # Arrange
+        next_execution = datetime.utcnow() + timedelta(hours=1)
+        for reminder_id in range(1, 201):
+            await scheduler_service.schedule_reminder(
+                _fast_reminder(reminder_id, next_execution=next_execution)
+            )
+        
+        # Act - unscheduling up to half leaves the stale entries in place
+        await scheduler_service.bulk_unschedule(list(range(1, 101)))
+        assert len(scheduler_service._heap) == 200
+        
+        await scheduler_service.unschedule_reminder(101)
+        
+        # Assert
+        assert len(scheduler_service._heap) == 99
+        assert {entry[2] for entry in scheduler_service._heap} == set(range(102, 201))
     
-    @pytest.mark.asyncio
     async def test_reschedule_reminder_not_scheduled(self, scheduler_service, sample_reminder):
         """Test rescheduling a reminder that wasn't scheduled"""
         # Act
@@ -148,7 +313,6 @@ class TestSchedulerService:
         # Assert - should just schedule it
         assert sample_reminder.id in scheduler_service._scheduled_reminders
     
-    @pytest.mark.asyncio
     async def test_get_scheduled_count(self, scheduler_service, sample_reminder):
         """Test getting count of scheduled reminders"""
         # Arrange
@@ -160,7 +324,6 @@ class TestSchedulerService:
         # Assert
         assert scheduler_service.get_scheduled_count() == 1
     
-    @pytest.mark.asyncio
     async def test_is_reminder_scheduled(self, scheduler_service, sample_reminder):
         """Test checking if reminder is scheduled"""
         # Arrange
@@ -172,22 +335,11 @@ class TestSchedulerService:
         # Assert
         assert scheduler_service.is_reminder_scheduled(sample_reminder.id) is True
     
-    @pytest.mark.asyncio
-    async def test_clear_all_scheduled(self, scheduler_service, sample_reminder):
+    async def test_clear_all_scheduled(self, scheduler_service, sample_reminder, second_reminder):
         """Test clearing all scheduled reminders"""
         # Arrange
         await scheduler_service.schedule_reminder(sample_reminder)
-        
-        reminder2 = Reminder(
-            user_id="987654321",
-            guild_id="123456789",
-            channel_id="111222333",
-            frequency=FrequencyEnum.WEEKLY,
-            message_content="Another reminder",
-            created_by="admin_456",
-            reminder_id=2
-        )
-        await scheduler_service.schedule_reminder(reminder2)
+        await scheduler_service.schedule_reminder(second_reminder)
         
         assert scheduler_service.get_scheduled_count() == 2
         
@@ -198,26 +350,47 @@ class TestSchedulerService:
         assert cleared_count == 2
         assert scheduler_service.get_scheduled_count() == 0
     
-    @pytest.mark.asyncio
-    async def test_reminder_execution_flow(self, scheduler_service, sample_reminder):
+    async def test_reminder_execution_flow(self, scheduler_service, mutable_reminder, executed):
         """Test the reminder execution flow"""
         # Arrange
-        with patch.object(scheduler_service, '_execute_reminder') as mock_execute:
-            mock_execute.return_value = AsyncMock()
-            
-            # Set execution time to very soon
-            sample_reminder.next_execution = datetime.utcnow() + timedelta(seconds=0.1)
-            
-            # Act
-            await scheduler_service.schedule_reminder(sample_reminder)
-            
-            # Wait for execution
-            await asyncio.sleep(0.2)
-            
-            # Assert
-            mock_execute.assert_called_once_with(sample_reminder)
-    
-    @pytest.mark.asyncio
+        # Set execution time to very soon
+        mutable_reminder.next_execution = datetime.utcnow() + timedelta(seconds=0.1)
+        
+        # Act
+        await scheduler_service.schedule_reminder(mutable_reminder)
+        
+        # Wait for execution
+        await executed.wait_for(1)
+        
+        # Assert
+        assert executed == [mutable_reminder]
+    
+    async def test_reminder_execution_does_not_inherit_caller_context(
+        self, mock_reminder_service, mutable_reminder
+    ):
+        """Test that contextvars bound when the service is built stay out of executions"""
+        # Arrange
+        caller_var = contextvars.ContextVar("caller_var")
+        caller_var.set("caller")
+        service = SchedulerService(reminder_service=mock_reminder_service)
+        seen = _ExecutionRecorder()
+        
+        async def execute(reminder):
+            await seen(caller_var.get(None))
+        
+        service._execute_reminder = execute
+        mutable_reminder.next_execution = datetime.utcnow() + timedelta(seconds=0.01)
+        
+        # Act
+        try:
+            await service.schedule_reminder(mutable_reminder)
+            await seen.wait_for(1)
+        finally:
+            await service.shutdown()
+        
+        # Assert
+        assert seen == [None]
+    
     async def test_scheduler_main_loop(self, scheduler_service, mock_reminder_service):
         """Test the main scheduler loop"""
         # Arrange
@@ -234,7 +407,6 @@ class TestSchedulerService:
         # Assert - should have called process_due_reminders multiple times
         assert mock_reminder_service.process_due_reminders.call_count >= 2
     
-    @pytest.mark.asyncio
     async def test_handle_scheduler_error(self, scheduler_service, mock_reminder_service):
         """Test scheduler error handling"""
         # Arrange
@@ -250,31 +422,13 @@ class TestSchedulerService:
         assert scheduler_service.is_running is False  # Stopped by us
         assert mock_reminder_service.process_due_reminders.call_count >= 1
     
-    @pytest.mark.asyncio
     async def test_get_next_execution_times(self, scheduler_service):
         """Test getting next execution times for scheduled reminders"""
         # Arrange
-        reminder1 = Reminder(
-            user_id="123456789",
-            guild_id="987654321",
-            channel_id="111222333",
-            frequency=FrequencyEnum.DAILY,
-            message_content="Daily reminder",
-            created_by="admin_123",
-            reminder_id=1
-        )
-        reminder1.next_execution = datetime.utcnow() + timedelta(hours=1)
-        
-        reminder2 = Reminder(
-            user_id="987654321",
-            guild_id="123456789",
-            channel_id="111222333",
-            frequency=FrequencyEnum.WEEKLY,
-            message_content="Weekly reminder",
-            created_by="admin_456",
-            reminder_id=2
+        reminder1 = _fast_reminder(1, next_execution=datetime.utcnow() + timedelta(hours=1))
+        reminder2 = _fast_reminder(
+            2, FrequencyEnum.WEEKLY, next_execution=datetime.utcnow() + timedelta(days=1)
         )
-        reminder2.next_execution = datetime.utcnow() + timedelta(days=1)
         
         await scheduler_service.schedule_reminder(reminder1)
         await scheduler_service.schedule_reminder(reminder2)
@@ -289,23 +443,35 @@ class TestSchedulerService:
         assert execution_times[1] == reminder1.next_execution
         assert execution_times[2] == reminder2.next_execution
     
-    @pytest.mark.asyncio
-    async def test_update_reminder_schedule(self, scheduler_service, sample_reminder):
-        """Test updating a reminder's schedule"""
+    async def test_get_scheduler_status(self, scheduler_service, sample_reminder):
+        """Test that the status reports each scheduled reminder's next execution"""
         # Arrange
         await scheduler_service.schedule_reminder(sample_reminder)
-        original_execution = sample_reminder.next_execution
+        
+        # Act
+        status = scheduler_service.get_scheduler_status()
+        
+        # Assert
+        assert status["scheduled_count"] == 1
+        assert status["next_executions"] == {
+            str(sample_reminder.id): sample_reminder.next_execution.isoformat()
+        }
+    
+    async def test_update_reminder_schedule(self, scheduler_service, mutable_reminder):
+        """Test updating a reminder's schedule"""
+        # Arrange
+        await scheduler_service.schedule_reminder(mutable_reminder)
+        original_execution = mutable_reminder.next_execution
         
         # Act
         new_execution = datetime.utcnow() + timedelta(hours=5)
-        await scheduler_service.update_reminder_schedule(sample_reminder.id, new_execution)
+        await scheduler_service.update_reminder_schedule(mutable_reminder.id, new_execution)
         
         # Assert
-        task_info = scheduler_service._scheduled_reminders[sample_reminder.id]
+        task_info = scheduler_service._scheduled_reminders[mutable_reminder.id]
         assert task_info["reminder"].next_execution == new_execution
         assert task_info["reminder"].next_execution != original_execution
     
-    @pytest.mark.asyncio
     async def test_update_reminder_schedule_not_found(self, scheduler_service):
         """Test updating schedule for non-existent reminder"""
         # Act
@@ -315,7 +481,6 @@ class TestSchedulerService:
         # Assert
         assert result is False
     
-    @pytest.mark.asyncio
     async def test_scheduler_shutdown_cleanup(self, scheduler_service, sample_reminder):
         """Test that scheduler properly cleans up on shutdown"""
         # Arrange
@@ -333,20 +498,14 @@ class TestSchedulerService:
         assert scheduler_service.get_scheduled_count() == 0
         assert scheduler_service._task is None
     
-    @pytest.mark.asyncio
-    async def test_scheduler_with_past_due_reminder(self, scheduler_service, sample_reminder):
+    async def test_scheduler_with_past_due_reminder(self, scheduler_service, mutable_reminder, executed):
         """Test scheduling a reminder that's already past due"""
         # Arrange
-        sample_reminder.next_execution = datetime.utcnow() - timedelta(hours=1)  # Past due
-        
-        with patch.object(scheduler_service, '_execute_reminder') as mock_execute:
-            mock_execute.return_value = AsyncMock()
-            
-            # Act
-            await scheduler_service.schedule_reminder(sample_reminder)
-            
-            # Wait a moment for immediate execution
-            await asyncio.sleep(0.1)
-            
-            # Assert
-            mock_execute.assert_called_once_with(sample_reminder)
\ No newline at end of file
+        mutable_reminder.next_execution = datetime.utcnow() - timedelta(hours=1)  # Past due
+        
+        # Act
+        await scheduler_service.schedule_reminder(mutable_reminder)
+        
+        # Assert - executed inline, never queued
+        assert executed == [mutable_reminder]
+        assert not scheduler_service.is_reminder_scheduled(mutable_reminder.id)
\ No newline at end of file
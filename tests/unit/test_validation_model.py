@@ -1,5 +1,6 @@
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from src.database.models import ValidationModel
 from src.models.validation import Validation
 from src.models.enums import ValidationStatus
 
@@ -160,4 +161,74 @@ class TestValidation:
         validation.mark_as_validated()
         
         with pytest.raises(ValueError, match="Validation already completed"):
-            validation.mark_as_validated()
\ No newline at end of file
+            validation.mark_as_validated()
+    
+    def test_reassigning_expires_at_updates_expiry(self):
+        """Test that is_expired follows a reassigned expires_at"""
+        validation = Validation(
+            reminder_id=1,
+            expires_at=datetime.utcnow() + timedelta(hours=1)
+        )
+        assert validation.is_expired() is False
+        
+        validation.expires_at = datetime.utcnow() - timedelta(hours=1)
+        assert validation.is_expired() is True
+        assert validation.time_until_expiry().total_seconds() < 0
+        
+        validation.expires_at = datetime.utcnow() + timedelta(hours=1)
+        assert validation.is_expired() is False
+    
+    @pytest.mark.parametrize("offset_hours,expired", [
+        (1, False),
+        (-1, True),
+    ])
+    def test_timezone_aware_expires_at(self, offset_hours, expired):
+        """Test that an aware expires_at in another zone is compared in UTC"""
+        # UTC+2 wall time for an instant offset_hours from now; read as naive
+        # UTC it would be two hours later than it really is
+        zone = timezone(timedelta(hours=2))
+        expires_at = datetime.now(zone) + timedelta(hours=offset_hours)
+        
+        validation = Validation(reminder_id=1, expires_at=expires_at)
+        
+        assert validation.is_expired() is expired
+        remaining = validation.time_until_expiry().total_seconds()
+        assert abs(remaining - offset_hours * 3600) < 60
+    
+    def test_expires_at_none(self):
+        """Test that a missing expires_at leaves no cached expiry behind"""
+        validation = Validation(
+            reminder_id=1,
+            expires_at=datetime.utcnow() - timedelta(hours=1)
+        )
+        
+        validation.expires_at = None
+        
+        assert validation.expires_at is None
+        # Without an expiry there is nothing to compare against, as before the
+        # cached timestamp existed; a stale cached answer must not be returned
+        with pytest.raises(TypeError):
+            validation.is_expired()
+        
+        validation.expires_at = datetime.utcnow() + timedelta(hours=1)
+        assert validation.is_expired() is False
+    
+    @pytest.mark.parametrize("status,value,label", [
+        (ValidationStatus.PENDING, 1, "pending"),
+        (ValidationStatus.VALIDATED, 2, "validated"),
+        (ValidationStatus.EXPIRED, 3, "expired"),
+        (ValidationStatus.FAILED, 4, "failed"),
+    ])
+    def test_validation_status_values_and_labels(self, status, value, label):
+        """Test the integer value and display label of each validation status"""
+        assert status == value
+        assert ValidationStatus(value) is status
+        assert status.label == label
+        assert status  # no status is falsy
+    
+    def test_validation_model_repr_uses_status_label(self):
+        """Test that the ORM model repr shows the readable status label"""
+        model = ValidationModel(id=1, reminder_id=2, status=ValidationStatus.PENDING)
+        
+        assert repr(model) == "<ValidationModel(id=1, reminder_id=2, status=pending)>"
+        assert "status=None" in repr(ValidationModel(id=1, reminder_id=2))